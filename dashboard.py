@@ -4,9 +4,36 @@ Shows monitor cards with real-time status updates
 """
 
 import customtkinter as ctk
-from tkinter import messagebox
+from tkinter import messagebox, TclError
 import threading
-from datetime import datetime
+import functools
+import time
+import queue
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Card background, card text color, status page text color and emoji per status
+_STATUS_STYLE = {
+    'UP': {'bg': "#1a5f1a", 'fg': "#4ade80", 'row_fg': "#22c55e", 'emoji': "✅"},
+    'DOWN': {'bg': "#5f1a1a", 'fg': "#ef4444", 'row_fg': "#ef4444", 'emoji': "❌"},
+}
+_DEFAULT_STYLE = {'bg': "#3f3f46", 'fg': "#a1a1aa", 'row_fg': "#a1a1aa", 'emoji': "❔"}
+
+# Height of one status page row including spacing (pixels)
+_STATUS_ROW_HEIGHT = 80
+
+# Long-lived background threads, so each keeps its pooled database connection
+# instead of opening one per job. Snapshot loads have a worker of their own;
+# manual checks and tests can take seconds on the network and must not delay them.
+_TASK_WORKERS = 4
+
+@functools.lru_cache(maxsize=32)
+def _font(size, weight="normal", family=None):
+    """Get a shared CTkFont instance (Tk font objects are costly to create)"""
+    if family is None:
+        return ctk.CTkFont(size=size, weight=weight)
+    return ctk.CTkFont(family=family, size=size, weight=weight)
 
 class Dashboard:
     def __init__(self, database, monitor_engine, notification_manager, username):
@@ -17,6 +44,63 @@ class Dashboard:
         self.window = None
         self.monitor_cards = {}
         self.current_view = "monitors"
+        
+        # Reusable card widgets for the current cards frame
+        self._card_pool = []
+        self._empty_label = None
+        
+        # Virtualized status page list
+        self._status_canvas = None
+        self._status_monitors = []
+        self._status_rows_shown = {}
+        self._status_row_pool = []
+        
+        # Coalesced status updates, flushed in a single UI pass
+        self._pending_updates = set()
+        self._flush_scheduled = False
+        self._pending_lock = threading.Lock()
+        
+        # Upper bound on how often status updates are flushed (seconds)
+        self._min_ui_interval = 0.25
+        self._last_ui_flush = 0.0
+        
+        # monitor_id -> (status, render time) of the card as last drawn
+        self._last_rendered_status = {}
+        
+        # Dialogs are built once, then hidden and reshown
+        self._add_monitor_dialog = None
+        self._settings_dialog = None
+        self._test_in_flight = False
+        
+        # Background jobs, (func, args): snapshot loads and slower tasks
+        self._load_queue = queue.Queue()
+        self._task_queue = queue.Queue()
+        threading.Thread(
+            target=self._background_loop, args=(self._load_queue,),
+            daemon=True, name="Dashboard-loader"
+        ).start()
+        for i in range(_TASK_WORKERS):
+            threading.Thread(
+                target=self._background_loop, args=(self._task_queue,),
+                daemon=True, name=f"Dashboard-task-{i}"
+            ).start()
+    
+    def _run_load(self, func, *args):
+        """Run a snapshot load func(*args) on the loader thread"""
+        self._load_queue.put((func, args))
+    
+    def _run_in_background(self, func, *args):
+        """Run a slower task func(*args) (checks, tests) on a task worker"""
+        self._task_queue.put((func, args))
+    
+    def _background_loop(self, jobs):
+        """Worker: run jobs from one queue one at a time"""
+        while True:
+            func, args = jobs.get()
+            try:
+                func(*args)
+            except Exception:
+                logger.exception("Background task failed")
     
     def show(self):
         """Display the main dashboard"""
@@ -38,6 +122,12 @@ class Dashboard:
         # Create main content area
         self.main_frame = ctk.CTkFrame(self.window, fg_color="transparent")
         self.main_frame.grid(row=0, column=1, sticky="nsew", padx=20, pady=20)
+        self.main_frame.grid_rowconfigure(0, weight=1)
+        self.main_frame.grid_columnconfigure(0, weight=1)
+        
+        # Views are built once and stacked; navigation raises one of them
+        self.monitors_view_frame = self.build_monitors_view()
+        self.status_view_frame = self.build_status_view()
         
         # Show monitors view by default
         self.show_monitors_view()
@@ -46,7 +136,7 @@ class Dashboard:
         self.monitor_engine.add_status_callback(self.on_status_change)
         
         # Start monitoring
-        threading.Thread(target=self.monitor_engine.start_all_monitors, daemon=True).start()
+        self._run_in_background(self.monitor_engine.start_all_monitors)
         
         # Handle window close
         self.window.protocol("WM_DELETE_WINDOW", self.on_closing)
@@ -63,7 +153,7 @@ class Dashboard:
         title = ctk.CTkLabel(
             sidebar,
             text="🔍 Uptime\nMonitor",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=_font(20, "bold")
         )
         title.pack(pady=(30, 5))
         
@@ -71,7 +161,7 @@ class Dashboard:
         user_label = ctk.CTkLabel(
             sidebar,
             text=f"👤 {self.username}",
-            font=ctk.CTkFont(size=12)
+            font=_font(12)
         )
         user_label.pack(pady=(0, 30))
         
@@ -122,24 +212,19 @@ class Dashboard:
         )
         logout_btn.pack(pady=(5, 20), padx=20, fill="x")
     
-    def clear_main_frame(self):
-        """Clear the main content area"""
-        for widget in self.main_frame.winfo_children():
-            widget.destroy()
-    
-    def show_monitors_view(self):
-        """Show the main monitors view with cards"""
-        self.current_view = "monitors"
-        self.clear_main_frame()
+    def build_monitors_view(self):
+        """Build the persistent monitors view (header; cards are added later)"""
+        view = ctk.CTkFrame(self.main_frame, fg_color="transparent")
+        view.grid(row=0, column=0, sticky="nsew")
         
         # Header
-        header_frame = ctk.CTkFrame(self.main_frame, fg_color="transparent")
+        header_frame = ctk.CTkFrame(view, fg_color="transparent")
         header_frame.pack(fill="x", pady=(0, 20))
         
         title = ctk.CTkLabel(
             header_frame,
             text="Monitors",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=_font(24, "bold")
         )
         title.pack(side="left")
         
@@ -151,72 +236,148 @@ class Dashboard:
         )
         refresh_btn.pack(side="right", padx=5)
         
-        # Scrollable frame for monitor cards
-        self.cards_frame = ctk.CTkScrollableFrame(self.main_frame)
-        self.cards_frame.pack(fill="both", expand=True)
+        # Scrollable frame for monitor cards is created by the first refresh
+        self.cards_frame = None
+        
+        return view
+    
+    def show_monitors_view(self):
+        """Show the main monitors view with cards"""
+        self.current_view = "monitors"
+        self.monitors_view_frame.tkraise()
         
-        # Load and display monitors
+        # Full reload so updates dropped while the view was hidden are picked up
         self.refresh_monitors()
     
+    def load_monitor_snapshot(self, monitor_ids=None):
+        """Load monitors with their 24h uptime (call from a worker thread)"""
+        if monitor_ids is None:
+            return self.db.get_all_monitors_with_uptime(hours=24)
+        
+        monitors = self.db.get_monitors_by_ids(monitor_ids)
+        
+        # Load uptime for every monitor in one query
+        uptimes = self.db.get_uptime_percentages([m['id'] for m in monitors], hours=24)
+        for monitor in monitors:
+            monitor['uptime'] = uptimes.get(monitor['id'], 0.0)
+        
+        return monitors
+    
     def refresh_monitors(self):
-        """Refresh the monitor cards"""
-        # Clear existing cards
-        for widget in self.cards_frame.winfo_children():
-            widget.destroy()
+        """Reload all monitors in the background and rebuild the cards"""
+        if self.current_view != "monitors":
+            # Cards are rebuilt when the monitors view is shown again
+            return
         
-        self.monitor_cards.clear()
+        self._run_load(self._load_monitors_then_render)
+    
+    def _load_monitors_then_render(self):
+        """Worker: load the monitor snapshot and hand it to the UI thread"""
+        snapshot = self.load_monitor_snapshot()
+        self.window.after(0, self._apply_monitor_snapshot, snapshot)
+    
+    def _apply_monitor_snapshot(self, monitors):
+        """Lay out the monitor cards, reusing pooled card widgets"""
+        if self.current_view != "monitors":
+            return
         
-        monitors = self.db.get_all_monitors()
+        if self.cards_frame is None:
+            # First render of this view: build in a hidden back buffer
+            buffer = ctk.CTkScrollableFrame(self.monitors_view_frame)
+            self._card_pool = []
+            self._empty_label = None
+            self.layout_cards(buffer, monitors)
+            buffer.update_idletasks()
+            
+            # Show the buffer with a single visible layout pass
+            self.cards_frame = buffer
+            self.cards_frame.pack(fill="both", expand=True)
+        else:
+            self.layout_cards(self.cards_frame, monitors)
         
-        if not monitors:
-            no_monitors = ctk.CTkLabel(
-                self.cards_frame,
-                text="No monitors configured.\nClick 'Add Monitor' to get started!",
-                font=ctk.CTkFont(size=16),
-                text_color="gray"
-            )
-            no_monitors.pack(pady=100)
+        # Level 1: fill in the detail labels on the next event loop turn
+        self.window.after(1, self._fill_card_details, monitors)
+    
+    def _fill_card_details(self, monitors):
+        """Set the response, last check and uptime labels of new cards"""
+        try:
+            for monitor in monitors:
+                card = self.monitor_cards.get(monitor['id'])
+                if card is None:
+                    continue
+                for key, text in self.format_card_fields(monitor).items():
+                    self.configure_if_changed(card[key], text=text)
+        except TclError:
+            # Cards were destroyed (view switched or window closing)
             return
+    
+    def layout_cards(self, parent, monitors):
+        """Bind pooled cards to monitors and grid them (name and status only)"""
+        self.monitor_cards.clear()
+        
+        if self._empty_label is not None:
+            self._empty_label.grid_remove()
         
-        # Create cards in a grid
-        row = 0
-        col = 0
+        # Grow the pool on demand; existing cards are rebound, not rebuilt
+        while len(self._card_pool) < len(monitors):
+            self._card_pool.append(self.create_monitor_card(parent))
+        
+        # Place cards in a grid
         max_cols = 2
         
-        for monitor in monitors:
-            card = self.create_monitor_card(monitor)
-            card.grid(row=row, column=col, padx=10, pady=10, sticky="ew")
+        for index, monitor in enumerate(monitors):
+            card = self._card_pool[index]
+            self.bind_card(card, monitor)
+            card['card'].grid(row=index // max_cols, column=index % max_cols, padx=10, pady=10, sticky="ew")
             self.monitor_cards[monitor['id']] = card
-            
-            col += 1
-            if col >= max_cols:
-                col = 0
-                row += 1
+        
+        # Hide unused cards; grid_remove keeps their options for reuse
+        for card in self._card_pool[len(monitors):]:
+            card['card'].grid_remove()
+            card['monitor_id'] = None
+        
+        if not monitors:
+            if self._empty_label is None:
+                self._empty_label = ctk.CTkLabel(
+                    parent,
+                    text="No monitors configured.\nClick 'Add Monitor' to get started!",
+                    font=_font(16),
+                    text_color="gray"
+                )
+            self._empty_label.grid(row=0, column=0, columnspan=max_cols, pady=100)
         
         # Configure grid columns
         for i in range(max_cols):
-            self.cards_frame.grid_columnconfigure(i, weight=1)
+            parent.grid_columnconfigure(i, weight=1)
     
-    def create_monitor_card(self, monitor):
-        """Create a monitor status card"""
-        status = monitor['status']
-        
-        # Determine color based on status
-        if status == 'UP':
-            bg_color = "#1a5f1a"
-            status_color = "#4ade80"
-            status_emoji = "✅"
-        elif status == 'DOWN':
-            bg_color = "#5f1a1a"
-            status_color = "#ef4444"
-            status_emoji = "❌"
+    def format_card_fields(self, monitor):
+        """Build the text for the data-dependent labels of a monitor card"""
+        if monitor.get('response_time'):
+            response_text = f"Response: {monitor['response_time']:.0f}ms"
         else:
-            bg_color = "#3f3f46"
-            status_color = "#a1a1aa"
-            status_emoji = "❔"
+            response_text = "Response: N/A"
         
+        if monitor.get('last_check'):
+            # Formatted by SQLite when the row is read
+            last_check_str = monitor.get('last_check_str') or monitor['last_check']
+            check_text = f"Last Check: {last_check_str}"
+        else:
+            check_text = "Last Check: Never"
+        
+        # Every snapshot loader fills in uptime off the UI thread
+        return {
+            'response_label': response_text,
+            'check_label': check_text,
+            'uptime_label': f"24h Uptime: {monitor['uptime']:.1f}%"
+        }
+    
+    def create_monitor_card(self, parent):
+        """
+        Create an unbound monitor card and return its widget handles
+        Cards are pooled; bind_card assigns them to a monitor
+        """
         # Card frame
-        card = ctk.CTkFrame(self.cards_frame, fg_color=bg_color, corner_radius=10)
+        card = ctk.CTkFrame(parent, corner_radius=10)
         
         # Header with name and status
         header = ctk.CTkFrame(card, fg_color="transparent")
@@ -224,17 +385,16 @@ class Dashboard:
         
         name_label = ctk.CTkLabel(
             header,
-            text=f"{monitor['name']}",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            text="",
+            font=_font(16, "bold"),
             anchor="w"
         )
         name_label.pack(side="left", fill="x", expand=True)
         
         status_label = ctk.CTkLabel(
             header,
-            text=f"{status_emoji} {status}",
-            font=ctk.CTkFont(size=14, weight="bold"),
-            text_color=status_color
+            text="",
+            font=_font(14, "bold")
         )
         status_label.pack(side="right")
         
@@ -244,8 +404,8 @@ class Dashboard:
         
         type_label = ctk.CTkLabel(
             info_frame,
-            text=f"Type: {monitor['type']}",
-            font=ctk.CTkFont(size=11),
+            text="",
+            font=_font(11),
             text_color="gray",
             anchor="w"
         )
@@ -253,45 +413,36 @@ class Dashboard:
         
         url_label = ctk.CTkLabel(
             info_frame,
-            text=f"URL: {monitor['url'][:50]}{'...' if len(monitor['url']) > 50 else ''}",
-            font=ctk.CTkFont(size=11),
+            text="",
+            font=_font(11),
             text_color="gray",
             anchor="w"
         )
         url_label.pack(anchor="w")
         
-        if monitor.get('response_time'):
-            response_label = ctk.CTkLabel(
-                info_frame,
-                text=f"Response: {monitor['response_time']:.0f}ms",
-                font=ctk.CTkFont(size=11),
-                text_color="gray",
-                anchor="w"
-            )
-            response_label.pack(anchor="w")
+        response_label = ctk.CTkLabel(
+            info_frame,
+            text="",
+            font=_font(11),
+            text_color="gray",
+            anchor="w"
+        )
+        response_label.pack(anchor="w")
         
-        if monitor.get('last_check'):
-            try:
-                last_check = datetime.fromisoformat(monitor['last_check'])
-                last_check_str = last_check.strftime("%Y-%m-%d %H:%M:%S")
-            except:
-                last_check_str = monitor['last_check']
-            
-            check_label = ctk.CTkLabel(
-                info_frame,
-                text=f"Last Check: {last_check_str}",
-                font=ctk.CTkFont(size=11),
-                text_color="gray",
-                anchor="w"
-            )
-            check_label.pack(anchor="w")
+        check_label = ctk.CTkLabel(
+            info_frame,
+            text="",
+            font=_font(11),
+            text_color="gray",
+            anchor="w"
+        )
+        check_label.pack(anchor="w")
         
         # Uptime percentage
-        uptime = self.db.get_uptime_percentage(monitor['id'], hours=24)
         uptime_label = ctk.CTkLabel(
             info_frame,
-            text=f"24h Uptime: {uptime:.1f}%",
-            font=ctk.CTkFont(size=11),
+            text="",
+            font=_font(11),
             text_color="gray",
             anchor="w"
         )
@@ -304,45 +455,180 @@ class Dashboard:
         check_btn = ctk.CTkButton(
             btn_frame,
             text="Check Now",
-            command=lambda m=monitor: self.manual_check(m['id']),
             width=80,
             height=28,
-            font=ctk.CTkFont(size=11)
+            font=_font(11)
         )
         check_btn.pack(side="left", padx=(0, 5))
         
         delete_btn = ctk.CTkButton(
             btn_frame,
             text="Delete",
-            command=lambda m=monitor: self.delete_monitor(m['id'], m['name']),
             width=80,
             height=28,
-            font=ctk.CTkFont(size=11),
+            font=_font(11),
             fg_color="#dc2626",
             hover_color="#b91c1c"
         )
         delete_btn.pack(side="right")
         
-        return card
+        return {
+            'monitor_id': None,
+            'card': card,
+            'name_label': name_label,
+            'status_label': status_label,
+            'type_label': type_label,
+            'url_label': url_label,
+            'response_label': response_label,
+            'check_label': check_label,
+            'uptime_label': uptime_label,
+            'check_btn': check_btn,
+            'delete_btn': delete_btn
+        }
+    
+    def bind_card(self, card, monitor):
+        """Point a pooled card at a monitor and show its name and status"""
+        if card['monitor_id'] != monitor['id']:
+            url = monitor['url']
+            card['name_label'].configure(text=f"{monitor['name']}")
+            card['type_label'].configure(text=f"Type: {monitor['type']}")
+            card['url_label'].configure(text=f"URL: {url[:50]}{'...' if len(url) > 50 else ''}")
+            card['check_btn'].configure(command=functools.partial(self.manual_check, monitor['id']))
+            card['delete_btn'].configure(
+                command=functools.partial(self.delete_monitor, monitor['id'], monitor['name'])
+            )
+            card['monitor_id'] = monitor['id']
+        
+        self.update_card_status(card, monitor)
+    
+    def update_card_status(self, card, monitor):
+        """Apply the status colors and label of a monitor to its card"""
+        status = monitor['status']
+        style = _STATUS_STYLE.get(status, _DEFAULT_STYLE)
+        
+        # Only reconfigure options whose value actually changed
+        self.configure_if_changed(card['card'], fg_color=style['bg'])
+        self.configure_if_changed(
+            card['status_label'],
+            text=f"{style['emoji']} {status}",
+            text_color=style['fg']
+        )
+        
+        self._last_rendered_status[monitor['id']] = (status, time.monotonic())
+    
+    def update_monitor_card(self, monitor):
+        """Update an existing monitor card in place"""
+        card = self.monitor_cards.get(monitor['id'])
+        if card is None:
+            # Monitor set changed (e.g. added elsewhere) - rebuild
+            self.refresh_monitors()
+            return
+        
+        self.update_card_status(card, monitor)
+        
+        for key, text in self.format_card_fields(monitor).items():
+            self.configure_if_changed(card[key], text=text)
+    
+    def configure_if_changed(self, widget, **options):
+        """Configure only the widget options that differ from their current value"""
+        changed = {key: value for key, value in options.items() if widget.cget(key) != value}
+        if changed:
+            widget.configure(**changed)
     
     def on_status_change(self, monitor_id, status):
         """Callback for when a monitor status changes"""
-        # Refresh the monitor card in the UI thread
-        if self.current_view == "monitors":
-            self.window.after(0, self.refresh_monitors)
+        if self.current_view != "monitors":
+            return
+        
+        # Skip no-op redraws: same status as rendered less than a second ago
+        last_rendered = self._last_rendered_status.get(monitor_id)
+        if last_rendered and last_rendered[0] == status and time.monotonic() - last_rendered[1] < 1:
+            return
+        
+        # Queue the monitor and schedule one flush for the whole burst
+        with self._pending_lock:
+            self._pending_updates.add(monitor_id)
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        
+        self.window.after(50, self._flush_updates)
+    
+    def _flush_updates(self):
+        """Load all pending status updates in the background"""
+        # Hidden view: drop the updates, show_monitors_view reloads everything
+        if self.current_view != "monitors":
+            with self._pending_lock:
+                self._pending_updates.clear()
+                self._flush_scheduled = False
+            return
+        
+        # Throttle: never flush more often than _min_ui_interval
+        elapsed = time.monotonic() - self._last_ui_flush
+        if elapsed < self._min_ui_interval:
+            self.window.after(int((self._min_ui_interval - elapsed) * 1000), self._flush_updates)
+            return
+        self._last_ui_flush = time.monotonic()
+        
+        with self._pending_lock:
+            monitor_ids = list(self._pending_updates)
+            self._pending_updates.clear()
+            self._flush_scheduled = False
+        
+        if not monitor_ids:
+            return
+        
+        self._run_load(self._load_updates_then_render, monitor_ids)
+    
+    def _load_updates_then_render(self, monitor_ids):
+        """Worker: load updated monitors and hand them to the UI thread"""
+        snapshot = self.load_monitor_snapshot(monitor_ids)
+        self.window.after(0, self._apply_updates, snapshot)
+    
+    def _apply_updates(self, monitors):
+        """Apply loaded status updates in a single UI pass"""
+        if self.current_view != "monitors":
+            return
+        
+        try:
+            for monitor in monitors:
+                self.update_monitor_card(monitor)
+        except TclError:
+            # Cards were destroyed (view switched or window closing)
+            return
     
     def manual_check(self, monitor_id):
         """Manually trigger a check for a monitor"""
         def do_check():
             result = self.monitor_engine.manual_check(monitor_id)
-            self.window.after(0, lambda: messagebox.showinfo(
+            self.window.after(0, lambda: self.show_toast(
                 "Check Complete",
                 f"Status: {result.get('status')}\n"
                 f"Response Time: {result.get('response_time', 'N/A')}\n"
                 f"Message: {result.get('error_message') or 'OK'}"
             ))
         
-        threading.Thread(target=do_check, daemon=True).start()
+        self._run_in_background(do_check)
+    
+    def show_toast(self, title, message, duration=2000):
+        """Show a non-modal message that dismisses itself"""
+        toast = ctk.CTkToplevel(self.window)
+        toast.overrideredirect(True)
+        toast.attributes("-topmost", True)
+        
+        title_label = ctk.CTkLabel(toast, text=title, font=_font(14, "bold"), anchor="w")
+        title_label.pack(fill="x", padx=20, pady=(15, 5))
+        
+        message_label = ctk.CTkLabel(toast, text=message, font=_font(12), justify="left", anchor="w")
+        message_label.pack(fill="x", padx=20, pady=(0, 15))
+        
+        # Place in the bottom-right corner of the dashboard
+        toast.update_idletasks()
+        x = self.window.winfo_rootx() + self.window.winfo_width() - toast.winfo_reqwidth() - 30
+        y = self.window.winfo_rooty() + self.window.winfo_height() - toast.winfo_reqheight() - 30
+        toast.geometry(f"+{x}+{y}")
+        
+        toast.after(duration, toast.destroy)
     
     def delete_monitor(self, monitor_id, monitor_name):
         """Delete a monitor"""
@@ -350,21 +636,44 @@ class Dashboard:
             self.monitor_engine.stop_monitor(monitor_id)
             self.db.delete_monitor(monitor_id)
             self.refresh_monitors()
-            messagebox.showinfo("Success", "Monitor deleted successfully")
+            self.show_toast("Success", "Monitor deleted successfully")
+    
+    def present_dialog(self, dialog, width, height):
+        """Center a (possibly hidden) dialog and show it modally"""
+        x = (dialog.winfo_screenwidth() // 2) - (width // 2)
+        y = (dialog.winfo_screenheight() // 2) - (height // 2)
+        dialog.geometry(f'{width}x{height}+{x}+{y}')
+        dialog.deiconify()
+        dialog.lift()
+        dialog.grab_set()
+    
+    def hide_dialog(self, dialog):
+        """Hide a reusable dialog instead of destroying it"""
+        dialog.grab_release()
+        dialog.withdraw()
     
     def show_add_monitor_dialog(self):
         """Show dialog to add a new monitor"""
+        if self._add_monitor_dialog is None:
+            self._add_monitor_dialog = self.build_add_monitor_dialog()
+        dialog = self._add_monitor_dialog
+        
+        # Reset the form from the previous use
+        for entry in (dialog.name_entry, dialog.url_entry, dialog.keyword_entry, dialog.interval_entry):
+            entry.delete(0, 'end')
+        dialog.interval_entry.insert(0, "60")
+        dialog.type_var.set("HTTP")
+        
+        self.present_dialog(dialog, 500, 600)
+        dialog.name_entry.focus()
+    
+    def build_add_monitor_dialog(self):
+        """Build the (initially hidden) add monitor dialog"""
         dialog = ctk.CTkToplevel(self.window)
+        dialog.withdraw()
         dialog.title("Add New Monitor")
-        dialog.geometry("500x600")
         dialog.transient(self.window)
-        dialog.grab_set()
-        
-        # Center dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (250)
-        y = (dialog.winfo_screenheight() // 2) - (300)
-        dialog.geometry(f'500x600+{x}+{y}')
+        dialog.protocol("WM_DELETE_WINDOW", lambda: self.hide_dialog(dialog))
         
         container = ctk.CTkFrame(dialog)
         container.pack(fill="both", expand=True, padx=30, pady=30)
@@ -372,7 +681,7 @@ class Dashboard:
         title = ctk.CTkLabel(
             container,
             text="Add New Monitor",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=_font(20, "bold")
         )
         title.pack(pady=(0, 20))
         
@@ -423,7 +732,6 @@ class Dashboard:
         interval_label.pack(pady=(10, 5), anchor="w")
         
         interval_entry = ctk.CTkEntry(container, width=400, placeholder_text="60")
-        interval_entry.insert(0, "60")
         interval_entry.pack(pady=(0, 20))
         
         def add_monitor():
@@ -453,7 +761,7 @@ class Dashboard:
             self.monitor_engine.start_monitor(monitor_id)
             
             messagebox.showinfo("Success", "Monitor added successfully!")
-            dialog.destroy()
+            self.hide_dialog(dialog)
             self.refresh_monitors()
         
         # Buttons
@@ -466,61 +774,191 @@ class Dashboard:
             command=add_monitor,
             width=180,
             height=40,
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         )
         add_btn.pack(side="left", padx=5)
         
         cancel_btn = ctk.CTkButton(
             btn_frame,
             text="Cancel",
-            command=dialog.destroy,
+            command=lambda: self.hide_dialog(dialog),
             width=180,
             height=40,
             fg_color="transparent",
             border_width=2
         )
         cancel_btn.pack(side="left", padx=5)
+        
+        # Keep entry handles for resetting the form on reuse
+        dialog.name_entry = name_entry
+        dialog.type_var = type_var
+        dialog.url_entry = url_entry
+        dialog.keyword_entry = keyword_entry
+        dialog.interval_entry = interval_entry
+        
+        return dialog
     
-    def show_status_page(self):
-        """Show the status summary page"""
-        self.current_view = "status"
-        self.clear_main_frame()
+    def build_status_view(self):
+        """Build the persistent status page (filled in by _apply_status_snapshot)"""
+        view = ctk.CTkFrame(self.main_frame, fg_color="transparent")
+        view.grid(row=0, column=0, sticky="nsew")
         
         # Header
-        header_frame = ctk.CTkFrame(self.main_frame, fg_color="transparent")
+        header_frame = ctk.CTkFrame(view, fg_color="transparent")
         header_frame.pack(fill="x", pady=(0, 20))
         
         title = ctk.CTkLabel(
             header_frame,
             text="Status Page",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=_font(24, "bold")
         )
         title.pack(side="left")
         
         # Overall statistics
-        monitors = self.db.get_all_monitors()
-        total_monitors = len(monitors)
-        up_count = sum(1 for m in monitors if m['status'] == 'UP')
-        down_count = sum(1 for m in monitors if m['status'] == 'DOWN')
-        
-        stats_frame = ctk.CTkFrame(self.main_frame)
+        stats_frame = ctk.CTkFrame(view)
         stats_frame.pack(fill="x", pady=(0, 20))
         
-        stat1 = self.create_stat_box(stats_frame, "Total Monitors", str(total_monitors), "#3b82f6")
-        stat1.pack(side="left", padx=10, pady=10, expand=True, fill="both")
+        self._stat_boxes = {}
+        for key, label, color in (
+            ('total', "Total Monitors", "#3b82f6"),
+            ('up', "Online", "#22c55e"),
+            ('down', "Offline", "#ef4444")
+        ):
+            box = self.create_stat_box(stats_frame, label, "0", color)
+            box.pack(side="left", padx=10, pady=10, expand=True, fill="both")
+            self._stat_boxes[key] = box
         
-        stat2 = self.create_stat_box(stats_frame, "Online", str(up_count), "#22c55e")
-        stat2.pack(side="left", padx=10, pady=10, expand=True, fill="both")
+        # Monitor list: only the rows inside the viewport are built
+        self.create_status_list(view)
         
-        stat3 = self.create_stat_box(stats_frame, "Offline", str(down_count), "#ef4444")
-        stat3.pack(side="left", padx=10, pady=10, expand=True, fill="both")
+        return view
+    
+    def show_status_page(self):
+        """Show the status summary page"""
+        self.current_view = "status"
+        self.status_view_frame.tkraise()
         
-        # Monitor list
-        list_frame = ctk.CTkScrollableFrame(self.main_frame)
+        self._run_load(self._load_status_then_render)
+    
+    def _load_status_then_render(self):
+        """Worker: load the status page data and hand it to the UI thread"""
+        snapshot = self.load_monitor_snapshot()
+        self.window.after(0, self._apply_status_snapshot, snapshot)
+    
+    def _apply_status_snapshot(self, monitors):
+        """Fill the status page from a loaded snapshot"""
+        if self.current_view != "status":
+            return
+        
+        # Overall statistics
+        counts = {
+            'total': len(monitors),
+            'up': sum(1 for m in monitors if m['status'] == 'UP'),
+            'down': sum(1 for m in monitors if m['status'] == 'DOWN')
+        }
+        for key, count in counts.items():
+            self.configure_if_changed(self._stat_boxes[key].value_label, text=str(count))
+        
+        self.set_status_list_monitors(monitors)
+    
+    def create_status_list(self, parent):
+        """Create the virtualized monitor list for the status page"""
+        frame_theme = ctk.ThemeManager.theme["CTkFrame"]
+        
+        list_frame = ctk.CTkFrame(parent)
         list_frame.pack(fill="both", expand=True)
         
-        for monitor in monitors:
-            self.create_status_row(list_frame, monitor).pack(fill="x", pady=5, padx=10)
+        canvas = ctk.CTkCanvas(
+            list_frame,
+            highlightthickness=0,
+            bg=self.theme_color(frame_theme["fg_color"])
+        )
+        scrollbar = ctk.CTkScrollbar(list_frame, command=canvas.yview)
+        scrollbar.pack(side="right", fill="y", padx=(0, 5), pady=5)
+        canvas.pack(side="left", fill="both", expand=True, padx=(10, 0), pady=5)
+        
+        def on_scroll(first, last):
+            scrollbar.set(first, last)
+            self.render_visible_status_rows()
+        
+        canvas.configure(yscrollcommand=on_scroll, scrollregion=(0, 0, 0, 0))
+        canvas.bind("<Configure>", lambda e: self.render_visible_status_rows())
+        # add="+" keeps CTkScrollableFrame's own wheel bindings working
+        self.window.bind_all("<MouseWheel>", self._on_status_mousewheel, add="+")
+        self.window.bind_all("<Button-4>", self._on_status_mousewheel, add="+")
+        self.window.bind_all("<Button-5>", self._on_status_mousewheel, add="+")
+        
+        self._status_canvas = canvas
+    
+    def set_status_list_monitors(self, monitors):
+        """Replace the monitors shown in the status list"""
+        canvas = self._status_canvas
+        
+        # Recycle every shown row; the visible ones are rebound below
+        for row in self._status_rows_shown.values():
+            canvas.delete(row['item'])
+            self._status_row_pool.append(row)
+        self._status_rows_shown = {}
+        
+        self._status_monitors = monitors
+        canvas.configure(scrollregion=(0, 0, 0, len(monitors) * _STATUS_ROW_HEIGHT))
+        self.render_visible_status_rows()
+    
+    def theme_color(self, color):
+        """Resolve a (light, dark) theme color for the current appearance mode"""
+        if isinstance(color, (list, tuple)):
+            return color[1] if ctk.get_appearance_mode() == "Dark" else color[0]
+        return color
+    
+    def _on_status_mousewheel(self, event):
+        """Scroll the status list with the mouse wheel"""
+        if self.current_view != "status" or self._status_canvas is None:
+            return
+        
+        if event.num == 4 or event.delta > 0:
+            self._status_canvas.yview_scroll(-1, "units")
+        else:
+            self._status_canvas.yview_scroll(1, "units")
+    
+    def render_visible_status_rows(self):
+        """Show rows for the monitors inside the viewport and recycle the rest"""
+        canvas = self._status_canvas
+        if canvas is None or self.current_view != "status":
+            return
+        
+        try:
+            width = canvas.winfo_width()
+            top = canvas.canvasy(0)
+            bottom = top + canvas.winfo_height()
+            first = max(int(top // _STATUS_ROW_HEIGHT), 0)
+            last = min(int(bottom // _STATUS_ROW_HEIGHT) + 1, len(self._status_monitors))
+            visible = range(first, last)
+            
+            # Recycle rows that scrolled out of view
+            for index in list(self._status_rows_shown):
+                if index not in visible:
+                    row = self._status_rows_shown.pop(index)
+                    canvas.delete(row['item'])
+                    self._status_row_pool.append(row)
+            
+            for index in visible:
+                row = self._status_rows_shown.get(index)
+                if row is None:
+                    row = self._status_row_pool.pop() if self._status_row_pool else self.create_status_row(canvas)
+                    self.bind_status_row(row, self._status_monitors[index])
+                    row['item'] = canvas.create_window(
+                        0, index * _STATUS_ROW_HEIGHT,
+                        window=row['row'],
+                        anchor="nw",
+                        width=width,
+                        height=_STATUS_ROW_HEIGHT - 10
+                    )
+                    self._status_rows_shown[index] = row
+                else:
+                    canvas.itemconfigure(row['item'], width=width)
+        except TclError:
+            # Canvas was destroyed (view switched or window closing)
+            return
     
     def create_stat_box(self, parent, label, value, color):
         """Create a statistics box"""
@@ -529,41 +967,33 @@ class Dashboard:
         value_label = ctk.CTkLabel(
             box,
             text=value,
-            font=ctk.CTkFont(size=32, weight="bold")
+            font=_font(32, "bold")
         )
         value_label.pack(pady=(20, 5))
+        box.value_label = value_label
         
         label_label = ctk.CTkLabel(
             box,
             text=label,
-            font=ctk.CTkFont(size=14)
+            font=_font(14)
         )
         label_label.pack(pady=(0, 20))
         
         return box
     
-    def create_status_row(self, parent, monitor):
-        """Create a status row for the status page"""
-        status = monitor['status']
-        
-        if status == 'UP':
-            color = "#22c55e"
-            emoji = "✅"
-        elif status == 'DOWN':
-            color = "#ef4444"
-            emoji = "❌"
-        else:
-            color = "#a1a1aa"
-            emoji = "❔"
-        
-        row = ctk.CTkFrame(parent, corner_radius=8)
+    def create_status_row(self, parent):
+        """Create an unbound status row for the status page"""
+        row = ctk.CTkFrame(
+            parent,
+            corner_radius=8,
+            fg_color=ctk.ThemeManager.theme["CTkFrame"]["top_fg_color"]
+        )
         
         # Status indicator
         status_label = ctk.CTkLabel(
             row,
-            text=f"{emoji} {status}",
-            font=ctk.CTkFont(size=12, weight="bold"),
-            text_color=color,
+            text="",
+            font=_font(12, "bold"),
             width=80
         )
         status_label.pack(side="left", padx=15, pady=15)
@@ -574,46 +1004,69 @@ class Dashboard:
         
         name_label = ctk.CTkLabel(
             info_frame,
-            text=monitor['name'],
-            font=ctk.CTkFont(size=14, weight="bold"),
+            text="",
+            font=_font(14, "bold"),
             anchor="w"
         )
         name_label.pack(anchor="w")
         
         url_label = ctk.CTkLabel(
             info_frame,
-            text=monitor['url'],
-            font=ctk.CTkFont(size=11),
+            text="",
+            font=_font(11),
             text_color="gray",
             anchor="w"
         )
         url_label.pack(anchor="w")
         
         # Uptime
-        uptime = self.db.get_uptime_percentage(monitor['id'], hours=24)
         uptime_label = ctk.CTkLabel(
             row,
-            text=f"{uptime:.1f}%",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            text="",
+            font=_font(14, "bold"),
             width=80
         )
         uptime_label.pack(side="right", padx=15, pady=15)
         
-        return row
+        return {
+            'row': row,
+            'status_label': status_label,
+            'name_label': name_label,
+            'url_label': url_label,
+            'uptime_label': uptime_label
+        }
+    
+    def bind_status_row(self, row, monitor):
+        """Show a monitor's status, name, URL and uptime in a status row"""
+        status = monitor['status']
+        style = _STATUS_STYLE.get(status, _DEFAULT_STYLE)
+        
+        row['status_label'].configure(text=f"{style['emoji']} {status}", text_color=style['row_fg'])
+        row['name_label'].configure(text=monitor['name'])
+        row['url_label'].configure(text=monitor['url'])
+        row['uptime_label'].configure(text=f"{monitor['uptime']:.1f}%")
     
     def show_settings(self):
         """Show settings dialog"""
+        if self._settings_dialog is None:
+            self._settings_dialog = self.build_settings_dialog()
+        dialog = self._settings_dialog
+        
+        # Load the current values into the reused entries
+        settings = self.db.get_settings_bulk(list(dialog.setting_entries))
+        for key, (entry, default) in dialog.setting_entries.items():
+            entry.delete(0, 'end')
+            entry.insert(0, settings.get(key, default))
+        
+        self.present_dialog(dialog, 600, 700)
+    
+    def build_settings_dialog(self):
+        """Build the (initially hidden) settings dialog"""
         dialog = ctk.CTkToplevel(self.window)
+        dialog.withdraw()
         dialog.title("Settings")
-        dialog.geometry("600x700")
         dialog.transient(self.window)
-        dialog.grab_set()
-        
-        # Center dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (300)
-        y = (dialog.winfo_screenheight() // 2) - (350)
-        dialog.geometry(f'600x700+{x}+{y}')
+        dialog.protocol("WM_DELETE_WINDOW", lambda: self.hide_dialog(dialog))
         
         container = ctk.CTkScrollableFrame(dialog)
         container.pack(fill="both", expand=True, padx=30, pady=30)
@@ -621,7 +1074,7 @@ class Dashboard:
         title = ctk.CTkLabel(
             container,
             text="⚙️ Notification Settings",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=_font(20, "bold")
         )
         title.pack(pady=(0, 20))
         
@@ -629,7 +1082,7 @@ class Dashboard:
         sns_label = ctk.CTkLabel(
             container,
             text="AWS SNS Configuration",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=_font(16, "bold")
         )
         sns_label.pack(pady=(10, 10), anchor="w")
         
@@ -638,8 +1091,6 @@ class Dashboard:
         aws_key_label.pack(pady=(10, 5), anchor="w")
         
         aws_key_entry = ctk.CTkEntry(container, width=500)
-        current_key = self.db.get_setting('aws_access_key', '')
-        aws_key_entry.insert(0, current_key)
         aws_key_entry.pack(pady=(0, 15))
         
         # AWS Secret Key
@@ -647,8 +1098,6 @@ class Dashboard:
         aws_secret_label.pack(pady=(10, 5), anchor="w")
         
         aws_secret_entry = ctk.CTkEntry(container, width=500, show="•")
-        current_secret = self.db.get_setting('aws_secret_key', '')
-        aws_secret_entry.insert(0, current_secret)
         aws_secret_entry.pack(pady=(0, 15))
         
         # AWS Region
@@ -656,8 +1105,6 @@ class Dashboard:
         aws_region_label.pack(pady=(10, 5), anchor="w")
         
         aws_region_entry = ctk.CTkEntry(container, width=500)
-        current_region = self.db.get_setting('aws_region', 'us-east-1')
-        aws_region_entry.insert(0, current_region)
         aws_region_entry.pack(pady=(0, 15))
         
         # SNS Topic ARN
@@ -665,8 +1112,6 @@ class Dashboard:
         sns_topic_label.pack(pady=(10, 5), anchor="w")
         
         sns_topic_entry = ctk.CTkEntry(container, width=500)
-        current_topic = self.db.get_setting('sns_topic_arn', '')
-        sns_topic_entry.insert(0, current_topic)
         sns_topic_entry.pack(pady=(0, 15))
         
         # Test SNS button
@@ -682,7 +1127,7 @@ class Dashboard:
         webhook_label = ctk.CTkLabel(
             container,
             text="Webhook Configuration",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=_font(16, "bold")
         )
         webhook_label.pack(pady=(20, 10), anchor="w")
         
@@ -691,8 +1136,6 @@ class Dashboard:
         webhook_url_label.pack(pady=(10, 5), anchor="w")
         
         webhook_url_entry = ctk.CTkEntry(container, width=500)
-        current_webhook = self.db.get_setting('webhook_url', '')
-        webhook_url_entry.insert(0, current_webhook)
         webhook_url_entry.pack(pady=(0, 15))
         
         # Test Webhook button
@@ -712,8 +1155,8 @@ class Dashboard:
                 sns_topic_arn=sns_topic_entry.get().strip() or None,
                 webhook_url=webhook_url_entry.get().strip() or None
             )
-            messagebox.showinfo("Success", "Settings saved successfully!")
-            dialog.destroy()
+            self.show_toast("Success", "Settings saved successfully!")
+            self.hide_dialog(dialog)
         
         # Save button
         save_btn = ctk.CTkButton(
@@ -722,24 +1165,46 @@ class Dashboard:
             command=save_settings,
             width=200,
             height=40,
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         )
         save_btn.pack(pady=(20, 0))
+        
+        # Setting key -> (entry, default) for reloading values on reuse
+        dialog.setting_entries = {
+            'aws_access_key': (aws_key_entry, ''),
+            'aws_secret_key': (aws_secret_entry, ''),
+            'aws_region': (aws_region_entry, 'us-east-1'),
+            'sns_topic_arn': (sns_topic_entry, ''),
+            'webhook_url': (webhook_url_entry, '')
+        }
+        
+        return dialog
     
     def test_notification(self, notification_type):
         """Test notification configuration"""
+        # Only one test at a time, so repeated clicks can't pile up dialogs
+        if self._test_in_flight:
+            self.show_toast("Test Running", "A notification test is already in progress")
+            return
+        self._test_in_flight = True
+        
         def do_test():
-            if notification_type == 'sns':
-                success, message = self.notification_manager.test_sns_connection()
-            else:
-                success, message = self.notification_manager.test_webhook_connection()
+            try:
+                if notification_type == 'sns':
+                    success, message = self.notification_manager.test_sns_connection(timeout=5)
+                else:
+                    success, message = self.notification_manager.test_webhook_connection(
+                        connect_timeout=3, read_timeout=5
+                    )
+            finally:
+                self._test_in_flight = False
             
             if success:
                 self.window.after(0, lambda: messagebox.showinfo("Test Successful", message))
             else:
                 self.window.after(0, lambda: messagebox.showerror("Test Failed", message))
         
-        threading.Thread(target=do_test, daemon=True).start()
+        self._run_in_background(do_test)
     
     def logout(self):
         """Logout and return to login screen"""
@@ -748,6 +1213,10 @@ class Dashboard:
     
     def on_closing(self):
         """Handle window closing"""
-        self.monitor_engine.stop_all_monitors()
+        # Don't let an in-flight check hold the UI open; daemon threads die with the process
+        stopper = threading.Thread(target=self.monitor_engine.stop_all_monitors, daemon=True)
+        stopper.start()
+        stopper.join(timeout=1.0)
+        
         self.window.quit()
         self.window.destroy()
@@ -5,26 +5,157 @@ Handles all SQLite operations for users, monitors, and status logs
 
 import sqlite3
 import bcrypt
-from datetime import datetime
+import collections
 from typing import List, Dict, Optional, Tuple
 import threading
+import atexit
+import contextlib
+import queue
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+# bcrypt work factor for new password hashes. Each +1 doubles hashing time:
+# 10 verifies in well under a second on typical desktops while staying
+# expensive to brute-force; raise it on faster hardware with BCRYPT_COST.
+DEFAULT_BCRYPT_COST = 10
+
+# Selects monitor rows with last_check (Unix epoch seconds) preformatted by
+# SQLite as local time for display
+_MONITOR_COLUMNS = "*, strftime('%Y-%m-%d %H:%M:%S', last_check, 'unixepoch', 'localtime') as last_check_str"
+
+# Hot-path statements, kept as shared constants so every caller hits the
+# connection's prepared-statement cache
+_SQL_GET_MONITOR = f"SELECT {_MONITOR_COLUMNS} FROM monitors WHERE id = ?"
+
+# Records one check; the status_logs_apply trigger updates the monitor row and
+# the uptime rollup. Monitors deleted while an update was queued are skipped.
+_SQL_INSERT_LOG = """
+    INSERT INTO status_logs (monitor_id, status, response_time, error_message)
+    SELECT ?, ?, ?, ? WHERE EXISTS (SELECT 1 FROM monitors WHERE id = ?)
+"""
+
+# Log rows are read-only, so they come back as tuples rather than a dict each
+LogRow = collections.namedtuple(
+    'LogRow', ['id', 'monitor_id', 'status', 'response_time', 'error_message', 'checked_at']
+)
+
+_SQL_GET_MONITOR_LOGS = """
+    SELECT id, monitor_id, status, response_time, error_message, checked_at
+    FROM status_logs 
+    WHERE monitor_id = ?
+    ORDER BY checked_at DESC
+    LIMIT ?
+"""
+
+# Notifications for a monitor deleted before the alert was sent are skipped,
+# so one such row can't fail the foreign key check for a whole batch
+_SQL_INSERT_NOTIFICATION = """
+    INSERT INTO notifications (monitor_id, notification_type, status, message)
+    SELECT ?, ?, ?, ? WHERE EXISTS (SELECT 1 FROM monitors WHERE id = ?)
+"""
+
+_SQL_GET_SETTING = "SELECT value FROM settings WHERE key = ?"
 
 class Database:
     def __init__(self, db_path: str = "uptime_monitor.db"):
         self.db_path = db_path
-        self.lock = threading.Lock()
+        
+        # Cost for new password hashes; older hashes are upgraded on login
+        self.bcrypt_cost = int(os.environ.get('BCRYPT_COST', DEFAULT_BCRYPT_COST))
+        
+        # One long-lived connection per thread, closed at exit
+        self._local = threading.local()
+        self._connections = {}
+        self._connections_lock = threading.Lock()
+        atexit.register(self.close_connections)
+        
+        # Status writes queued by the monitor threads, committed in batches
+        self.write_interval = 1.0
+        self._write_queue = queue.Queue()
+        self._write_ready = threading.Event()
+        self._flush_requested = threading.Event()
+        self._write_listeners = []
+        self._writer_thread = None
+        self._writer_lock = threading.Lock()
+        atexit.register(self.flush_writes)
+        
         self.init_database()
     
     def get_connection(self):
-        """Create a new database connection"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """Get this thread's pooled database connection"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # Autocommit mode; writes open their own BEGIN IMMEDIATE transactions
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256,
+                                   isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            self.apply_pragmas(conn)
+            self._local.conn = conn
+            with self._connections_lock:
+                self._prune_connections()
+                self._connections[threading.current_thread()] = conn
         return conn
     
+    def _prune_connections(self):
+        """Close connections left behind by threads that have exited"""
+        for thread in [t for t in self._connections if not t.is_alive()]:
+            self._close_quietly(self._connections.pop(thread))
+    
+    @staticmethod
+    def _close_quietly(conn):
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+    
+    def close_connections(self):
+        """Close every pooled connection"""
+        with self._connections_lock:
+            for conn in self._connections.values():
+                self._close_quietly(conn)
+            self._connections.clear()
+    
+    def apply_pragmas(self, conn):
+        """Apply the per-connection performance settings"""
+        # WAL makes NORMAL safe: commits no longer fsync the main database
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-64000")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("PRAGMA foreign_keys=ON")
+        conn.execute("PRAGMA wal_autocheckpoint=1000")
+    
+    @contextlib.contextmanager
+    def transaction(self):
+        """Run a block of writes in one BEGIN IMMEDIATE ... COMMIT"""
+        # Taking the write lock up front means SQLite's busy_timeout handles
+        # contention instead of a mid-transaction SQLITE_BUSY
+        conn = self.get_connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+    
     def init_database(self):
         """Initialize database schema"""
-        with self.lock:
-            conn = self.get_connection()
+        # These pragmas cannot run inside a transaction
+        conn = self.get_connection()
+        
+        # Let pruned log pages be returned to the OS a chunk at a time
+        # (only takes effect before the first table is created)
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        
+        # Write-ahead logging lets readers run alongside the monitor writers
+        # (persistent, so only needs to be set once per database file)
+        if self.db_path != ":memory:":
+            conn.execute("PRAGMA journal_mode=WAL")
+        
+        with self.transaction() as conn:
             cursor = conn.cursor()
             
             # Users table
@@ -47,13 +178,20 @@ class Database:
                     keyword TEXT,
                     interval INTEGER DEFAULT 60,
                     status TEXT DEFAULT 'UNKNOWN',
-                    last_check TIMESTAMP,
+                    last_check INTEGER,
                     response_time REAL,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     enabled INTEGER DEFAULT 1
                 )
             """)
             
+            # last_check used to hold local datetime text; convert it to epoch seconds
+            cursor.execute("""
+                UPDATE monitors
+                SET last_check = CAST(strftime('%s', last_check, 'utc') AS INTEGER)
+                WHERE typeof(last_check) = 'text'
+            """)
+            
             # Status logs table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS status_logs (
@@ -67,6 +205,28 @@ class Database:
                 )
             """)
             
+            # Hourly uptime rollup, maintained alongside status_logs
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'uptime_stats'")
+            backfill_stats = cursor.fetchone() is None
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS uptime_stats (
+                    monitor_id INTEGER NOT NULL,
+                    bucket TEXT NOT NULL,
+                    up INTEGER NOT NULL DEFAULT 0,
+                    total INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (monitor_id, bucket),
+                    FOREIGN KEY (monitor_id) REFERENCES monitors(id) ON DELETE CASCADE
+                ) WITHOUT ROWID
+            """)
+            if backfill_stats:
+                cursor.execute("""
+                    INSERT INTO uptime_stats (monitor_id, bucket, up, total)
+                    SELECT monitor_id, strftime('%Y-%m-%d %H', checked_at),
+                           SUM(CASE WHEN status = 'UP' THEN 1 ELSE 0 END), COUNT(*)
+                    FROM status_logs
+                    GROUP BY monitor_id, strftime('%Y-%m-%d %H', checked_at)
+                """)
+            
             # Notifications table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS notifications (
@@ -88,201 +248,385 @@ class Database:
                 )
             """)
             
-            conn.commit()
-            conn.close()
+            # Indexes for performance
+            # Covers the uptime aggregates (monitor, time range, status) and the
+            # newest-first log listing without touching the table rows
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_status_logs_monitor_time_status
+                ON status_logs(monitor_id, checked_at DESC, status)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_notifications_monitor
+                ON notifications(monitor_id, sent_at)
+            """)
+            
+            # Apply each logged check to its monitor and the uptime rollup, so
+            # a status update is a single INSERT
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS status_logs_apply
+                AFTER INSERT ON status_logs
+                BEGIN
+                    UPDATE monitors
+                    SET status = NEW.status,
+                        response_time = NEW.response_time,
+                        last_check = CAST(strftime('%s', NEW.checked_at) AS INTEGER)
+                    WHERE id = NEW.monitor_id;
+                    
+                    INSERT INTO uptime_stats (monitor_id, bucket, up, total)
+                    VALUES (NEW.monitor_id, strftime('%Y-%m-%d %H', NEW.checked_at), NEW.status = 'UP', 1)
+                    ON CONFLICT (monitor_id, bucket) DO UPDATE
+                    SET up = up + excluded.up, total = total + 1;
+                END
+            """)
     
     # User Management
     def create_user(self, username: str, password: str) -> bool:
         """Create a new user with hashed password"""
         try:
-            password_hash = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
+            password_hash = self._hash_password(password)
             
-            with self.lock:
-                conn = self.get_connection()
+            with self.transaction() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     "INSERT INTO users (username, password_hash) VALUES (?, ?)",
                     (username, password_hash)
                 )
-                conn.commit()
-                conn.close()
             return True
         except sqlite3.IntegrityError:
             return False
     
     def verify_user(self, username: str, password: str) -> bool:
         """Verify user credentials"""
-        with self.lock:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT password_hash FROM users WHERE username = ?", (username,))
-            result = cursor.fetchone()
-            conn.close()
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT password_hash FROM users WHERE username = ?", (username,))
+        result = cursor.fetchone()
         
         if result:
             stored_hash = result['password_hash']
-            return bcrypt.checkpw(password.encode('utf-8'), stored_hash)
+            if isinstance(stored_hash, str):
+                stored_hash = stored_hash.encode('utf-8')
+            
+            if not self._check_password(password, stored_hash):
+                return False
+            
+            # Transparently move the account to the configured cost
+            if self._bcrypt_cost(stored_hash) != self.bcrypt_cost:
+                self._rehash_password(username, password)
+            return True
         return False
     
+    @staticmethod
+    def _bcrypt_cost(password_hash: bytes) -> Optional[int]:
+        """Read the work factor from a '$2b$<cost>$...' hash"""
+        try:
+            return int(password_hash.split(b'$')[2])
+        except (IndexError, ValueError):
+            return None
+    
+    def _hash_password(self, password: str) -> bytes:
+        """Hash a password at the configured cost"""
+        # bcrypt 4.x is a compiled extension that releases the GIL while hashing,
+        # so this is already native speed; all hashing goes through these two
+        # helpers so a different backend only needs changing here
+        return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=self.bcrypt_cost))
+    
+    @staticmethod
+    def _check_password(password: str, password_hash: bytes) -> bool:
+        return bcrypt.checkpw(password.encode('utf-8'), password_hash)
+    
+    def _rehash_password(self, username: str, password: str):
+        password_hash = self._hash_password(password)
+        with self.transaction() as conn:
+            conn.execute(
+                "UPDATE users SET password_hash = ? WHERE username = ?",
+                (password_hash, username)
+            )
+    
     def user_exists(self, username: str) -> bool:
         """Check if a user exists"""
-        with self.lock:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) as count FROM users WHERE username = ?", (username,))
-            result = cursor.fetchone()
-            conn.close()
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*) as count FROM users WHERE username = ?", (username,))
+        result = cursor.fetchone()
         return result['count'] > 0
     
     # Monitor Management
     def add_monitor(self, name: str, monitor_type: str, url: str, 
                     keyword: str = None, interval: int = 60) -> int:
         """Add a new monitor"""
-        with self.lock:
-            conn = self.get_connection()
+        with self.transaction() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT INTO monitors (name, type, url, keyword, interval, status)
                 VALUES (?, ?, ?, ?, ?, 'UNKNOWN')
             """, (name, monitor_type, url, keyword, interval))
             monitor_id = cursor.lastrowid
-            conn.commit()
-            conn.close()
         return monitor_id
     
     def get_all_monitors(self) -> List[Dict]:
         """Get all monitors"""
-        with self.lock:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT * FROM monitors ORDER BY created_at DESC
-            """)
-            monitors = [dict(row) for row in cursor.fetchall()]
-            conn.close()
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute(f"""
+            SELECT {_MONITOR_COLUMNS} FROM monitors ORDER BY created_at DESC
+        """)
+        monitors = [dict(row) for row in cursor.fetchall()]
+        return monitors
+    
+    def get_all_monitors_with_uptime(self, hours: int = 24) -> List[Dict]:
+        """Get all monitors with their uptime percentage in a single query"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT m.*, strftime('%Y-%m-%d %H:%M:%S', m.last_check, 'unixepoch', 'localtime') as last_check_str,
+                   COALESCE(s.uptime, 0.0) as uptime
+            FROM monitors m
+            LEFT JOIN (
+                SELECT monitor_id, SUM(up) * 100.0 / SUM(total) as uptime
+                FROM uptime_stats
+                WHERE bucket >= strftime('%Y-%m-%d %H', 'now', '-' || ? || ' hours')
+                GROUP BY monitor_id
+            ) s ON s.monitor_id = m.id
+            ORDER BY m.created_at DESC
+        """, (hours,))
+        monitors = [dict(row) for row in cursor.fetchall()]
         return monitors
     
     def get_monitor(self, monitor_id: int) -> Optional[Dict]:
         """Get a specific monitor"""
-        with self.lock:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM monitors WHERE id = ?", (monitor_id,))
-            result = cursor.fetchone()
-            conn.close()
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute(_SQL_GET_MONITOR, (monitor_id,))
+        result = cursor.fetchone()
         return dict(result) if result else None
     
+    def get_monitors_by_ids(self, monitor_ids: List[int]) -> List[Dict]:
+        """Get several monitors with a single query"""
+        if not monitor_ids:
+            return []
+        
+        placeholders = ", ".join("?" for _ in monitor_ids)
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute(
+            f"SELECT {_MONITOR_COLUMNS} FROM monitors WHERE id IN ({placeholders})",
+            list(monitor_ids)
+        )
+        monitors = [dict(row) for row in cursor.fetchall()]
+        return monitors
+    
     def update_monitor_status(self, monitor_id: int, status: str, 
                              response_time: float = None, error_message: str = None):
         """Update monitor status and log it"""
-        with self.lock:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            # Update monitor
-            cursor.execute("""
-                UPDATE monitors 
-                SET status = ?, last_check = ?, response_time = ?
-                WHERE id = ?
-            """, (status, datetime.now(), response_time, monitor_id))
-            
-            # Log status
-            cursor.execute("""
-                INSERT INTO status_logs (monitor_id, status, response_time, error_message)
-                VALUES (?, ?, ?, ?)
-            """, (monitor_id, status, response_time, error_message))
+        with self.transaction() as conn:
+            self._apply_status_updates(
+                conn, [(monitor_id, status, response_time, error_message)]
+            )
+    
+    def enqueue_status_update(self, monitor_id: int, status: str,
+                              response_time: float = None, error_message: str = None):
+        """Queue a status update for the batched writer thread"""
+        self._write_queue.put((monitor_id, status, response_time, error_message))
+        self._write_ready.set()
+        self._start_writer()
+    
+    def add_write_listener(self, callback):
+        """Call callback(monitor_id, status) for each queued update once committed"""
+        self._write_listeners.append(callback)
+    
+    def flush_writes(self):
+        """Commit every queued status update now"""
+        if self._writer_thread is None and self._write_queue.empty():
+            return
+        
+        # The writer does the commit so updates stay in queue order
+        self._start_writer()
+        self._flush_requested.set()
+        self._write_queue.join()
+    
+    def _start_writer(self):
+        if self._writer_thread is not None:
+            return
+        with self._writer_lock:
+            if self._writer_thread is None:
+                self._writer_thread = threading.Thread(
+                    target=self._write_loop, daemon=True, name="DB-Writer"
+                )
+                self._writer_thread.start()
+    
+    def _write_loop(self):
+        """Drain the write queue about once per write_interval"""
+        while True:
+            # Updates stay queued while waiting, so flush_writes never misses one
+            self._write_ready.wait()
+            self._flush_requested.wait(self.write_interval)
+            self._write_ready.clear()
+            self._flush_requested.clear()
             
-            conn.commit()
-            conn.close()
+            batch = self._drain_write_queue()
+            try:
+                self._write_batch(batch)
+            except Exception as e:
+                logger.error(f"Failed to write {len(batch)} status updates: {e}")
+            finally:
+                for _ in batch:
+                    self._write_queue.task_done()
+    
+    def _drain_write_queue(self) -> List[Tuple]:
+        batch = []
+        while True:
+            try:
+                batch.append(self._write_queue.get_nowait())
+            except queue.Empty:
+                return batch
+    
+    def _write_batch(self, batch: List[Tuple]):
+        """Apply queued status updates in a single transaction"""
+        if not batch:
+            return
+        
+        # SQLite's own write lock serialises this against other writers
+        with self.transaction() as conn:
+            self._apply_status_updates(conn, batch)
+        
+        for monitor_id, status, _, _ in batch:
+            for callback in self._write_listeners:
+                try:
+                    callback(monitor_id, status)
+                except Exception as e:
+                    logger.error(f"Error in write listener: {e}")
+    
+    @staticmethod
+    def _apply_status_updates(conn, batch: List[Tuple]):
+        """Write (monitor_id, status, response_time, error) rows"""
+        conn.executemany(_SQL_INSERT_LOG, [
+            (monitor_id, status, response_time, error_message, monitor_id)
+            for monitor_id, status, response_time, error_message in batch
+        ])
     
     def delete_monitor(self, monitor_id: int):
         """Delete a monitor"""
-        with self.lock:
-            conn = self.get_connection()
+        with self.transaction() as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM monitors WHERE id = ?", (monitor_id,))
-            conn.commit()
-            conn.close()
     
     def toggle_monitor(self, monitor_id: int, enabled: bool):
         """Enable or disable a monitor"""
-        with self.lock:
-            conn = self.get_connection()
+        with self.transaction() as conn:
             cursor = conn.cursor()
             cursor.execute("UPDATE monitors SET enabled = ? WHERE id = ?", 
                          (1 if enabled else 0, monitor_id))
-            conn.commit()
-            conn.close()
     
     # Status Logs
-    def get_monitor_logs(self, monitor_id: int, limit: int = 100) -> List[Dict]:
+    def get_monitor_logs(self, monitor_id: int, limit: int = 100) -> List[LogRow]:
         """Get recent logs for a monitor"""
-        with self.lock:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT * FROM status_logs 
-                WHERE monitor_id = ?
-                ORDER BY checked_at DESC
-                LIMIT ?
-            """, (monitor_id, limit))
-            logs = [dict(row) for row in cursor.fetchall()]
-            conn.close()
-        return logs
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.row_factory = lambda _, row: LogRow(*row)
+        cursor.execute(_SQL_GET_MONITOR_LOGS, (monitor_id, limit))
+        return cursor.fetchall()
     
     def get_uptime_percentage(self, monitor_id: int, hours: int = 24) -> float:
         """Calculate uptime percentage for a monitor"""
-        with self.lock:
-            conn = self.get_connection()
+        return self.get_uptime_percentages([monitor_id], hours).get(monitor_id, 0.0)
+    
+    def get_uptime_percentages(self, monitor_ids: List[int], hours: int = 24) -> Dict[int, float]:
+        """Calculate uptime percentages for several monitors with a single query"""
+        if not monitor_ids:
+            return {}
+        
+        placeholders = ", ".join("?" for _ in monitor_ids)
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        # Read the hourly rollup rather than scanning status_logs; the window
+        # starts at the top of the hour, so it may include up to an hour more
+        cursor.execute(f"""
+            SELECT 
+                monitor_id,
+                SUM(up) * 100.0 / SUM(total) as uptime
+            FROM uptime_stats
+            WHERE monitor_id IN ({placeholders})
+            AND bucket >= strftime('%Y-%m-%d %H', 'now', '-' || ? || ' hours')
+            GROUP BY monitor_id
+        """, (*monitor_ids, hours))
+        uptimes = {row['monitor_id']: row['uptime'] for row in cursor.fetchall()}
+        return uptimes
+    
+    def prune_logs(self, days: int = 30, vacuum_pages: int = 1000) -> int:
+        """Delete status logs older than days and reclaim some free pages"""
+        with self.transaction() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT 
-                    COUNT(*) as total,
-                    SUM(CASE WHEN status = 'UP' THEN 1 ELSE 0 END) as up_count
-                FROM status_logs
-                WHERE monitor_id = ?
-                AND checked_at >= datetime('now', '-' || ? || ' hours')
-            """, (monitor_id, hours))
-            result = cursor.fetchone()
-            conn.close()
+            cursor.execute(
+                "DELETE FROM status_logs WHERE checked_at < datetime('now', '-' || ? || ' days')",
+                (days,)
+            )
+            deleted = cursor.rowcount
+            cursor.execute(
+                "DELETE FROM uptime_stats WHERE bucket < strftime('%Y-%m-%d %H', 'now', '-' || ? || ' days')",
+                (days,)
+            )
         
-        if result and result['total'] > 0:
-            return (result['up_count'] / result['total']) * 100
-        return 0.0
+        # executescript steps the pragma to completion; execute() would free one page
+        self.get_connection().executescript(f"PRAGMA incremental_vacuum({int(vacuum_pages)});")
+        return deleted
     
     # Notifications
     def log_notification(self, monitor_id: int, notification_type: str, 
                         status: str, message: str):
         """Log a sent notification"""
-        with self.lock:
-            conn = self.get_connection()
+        with self.transaction() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO notifications (monitor_id, notification_type, status, message)
-                VALUES (?, ?, ?, ?)
-            """, (monitor_id, notification_type, status, message))
-            conn.commit()
-            conn.close()
+            cursor.execute(
+                _SQL_INSERT_NOTIFICATION,
+                (monitor_id, notification_type, status, message, monitor_id)
+            )
+    
+    def log_notifications_bulk(self, rows: List[Tuple]):
+        """Log several (monitor_id, type, status, message) rows in one transaction"""
+        with self.transaction() as conn:
+            conn.executemany(_SQL_INSERT_NOTIFICATION, [
+                (monitor_id, notification_type, status, message, monitor_id)
+                for monitor_id, notification_type, status, message in rows
+            ])
     
     # Settings
     def get_setting(self, key: str, default: str = None) -> Optional[str]:
         """Get a setting value"""
-        with self.lock:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT value FROM settings WHERE key = ?", (key,))
-            result = cursor.fetchone()
-            conn.close()
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute(_SQL_GET_SETTING, (key,))
+        result = cursor.fetchone()
         return result['value'] if result else default
     
+    def get_settings_bulk(self, keys: List[str]) -> Dict[str, str]:
+        """Get several setting values with a single query"""
+        if not keys:
+            return {}
+        
+        placeholders = ", ".join("?" for _ in keys)
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute(
+            f"SELECT key, value FROM settings WHERE key IN ({placeholders})",
+            list(keys)
+        )
+        settings = {row['key']: row['value'] for row in cursor.fetchall()}
+        return settings
+    
+    def set_settings(self, settings: Dict[str, str]):
+        """Set several setting values in one transaction"""
+        with self.transaction() as conn:
+            conn.executemany("""
+                INSERT OR REPLACE INTO settings (key, value)
+                VALUES (?, ?)
+            """, list(settings.items()))
+    
     def set_setting(self, key: str, value: str):
         """Set a setting value"""
-        with self.lock:
-            conn = self.get_connection()
+        with self.transaction() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT OR REPLACE INTO settings (key, value)
                 VALUES (?, ?)
             """, (key, value))
-            conn.commit()
-            conn.close()
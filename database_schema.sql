@@ -1,6 +1,7 @@
 -- Uptime Monitor Database Schema
 -- This file is for reference only - the database is created automatically by the application
 -- SQLite database: uptime_monitor.db
+-- New databases use PRAGMA auto_vacuum=INCREMENTAL; logs older than 30 days are pruned daily
 
 -- Users table - stores user credentials with bcrypt hashed passwords
 CREATE TABLE IF NOT EXISTS users (
@@ -19,7 +20,7 @@ CREATE TABLE IF NOT EXISTS monitors (
     keyword TEXT,                           -- Keyword to search for (KEYWORD type only)
     interval INTEGER DEFAULT 60,            -- Check interval in seconds
     status TEXT DEFAULT 'UNKNOWN',          -- Current status: UP, DOWN, UNKNOWN, ERROR
-    last_check TIMESTAMP,                   -- Last check timestamp
+    last_check INTEGER,                     -- Last check time, Unix epoch seconds
     response_time REAL,                     -- Response time in milliseconds
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     enabled INTEGER DEFAULT 1               -- 1 = enabled, 0 = disabled
@@ -36,6 +37,16 @@ CREATE TABLE IF NOT EXISTS status_logs (
     FOREIGN KEY (monitor_id) REFERENCES monitors(id) ON DELETE CASCADE
 );
 
+-- Uptime stats table - hourly rollup of status_logs for fast uptime queries
+CREATE TABLE IF NOT EXISTS uptime_stats (
+    monitor_id INTEGER NOT NULL,           -- Reference to monitors table
+    bucket TEXT NOT NULL,                   -- UTC hour, 'YYYY-MM-DD HH'
+    up INTEGER NOT NULL DEFAULT 0,          -- Checks in this hour that were UP
+    total INTEGER NOT NULL DEFAULT 0,       -- All checks in this hour
+    PRIMARY KEY (monitor_id, bucket),
+    FOREIGN KEY (monitor_id) REFERENCES monitors(id) ON DELETE CASCADE
+) WITHOUT ROWID;
+
 -- Notifications table - log of sent notifications
 CREATE TABLE IF NOT EXISTS notifications (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -56,7 +67,7 @@ CREATE TABLE IF NOT EXISTS settings (
 -- Indexes for performance
 CREATE INDEX IF NOT EXISTS idx_monitors_status ON monitors(status);
 CREATE INDEX IF NOT EXISTS idx_monitors_enabled ON monitors(enabled);
-CREATE INDEX IF NOT EXISTS idx_status_logs_monitor ON status_logs(monitor_id, checked_at);
+CREATE INDEX IF NOT EXISTS idx_status_logs_monitor_time_status ON status_logs(monitor_id, checked_at DESC, status);
 CREATE INDEX IF NOT EXISTS idx_notifications_monitor ON notifications(monitor_id, sent_at);
 
 -- Sample data (for testing - commented out)
@@ -77,6 +88,22 @@ INSERT INTO settings (key, value) VALUES
 ('webhook_url', 'https://hooks.slack.com/services/YOUR/WEBHOOK/URL');
 */
 
+-- Trigger: each logged check updates its monitor and the hourly uptime rollup
+CREATE TRIGGER IF NOT EXISTS status_logs_apply
+AFTER INSERT ON status_logs
+BEGIN
+    UPDATE monitors
+    SET status = NEW.status,
+        response_time = NEW.response_time,
+        last_check = CAST(strftime('%s', NEW.checked_at) AS INTEGER)
+    WHERE id = NEW.monitor_id;
+    
+    INSERT INTO uptime_stats (monitor_id, bucket, up, total)
+    VALUES (NEW.monitor_id, strftime('%Y-%m-%d %H', NEW.checked_at), NEW.status = 'UP', 1)
+    ON CONFLICT (monitor_id, bucket) DO UPDATE
+    SET up = up + excluded.up, total = total + 1;
+END;
+
 -- Views for reporting (optional)
 
 -- View: Monitor summary with latest status
@@ -4,12 +4,17 @@ Login Screen using CustomTkinter
 
 import customtkinter as ctk
 from tkinter import messagebox
+import concurrent.futures
 
 class LoginScreen:
     def __init__(self, database, on_login_success):
         self.db = database
         self.on_login_success = on_login_success
         self.window = None
+        
+        # bcrypt is CPU-bound; verify off the Tk thread so the window stays responsive
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._login_future = None
     
     def show(self):
         """Display the login window"""
@@ -72,7 +77,7 @@ class LoginScreen:
         self.password_entry.pack(pady=(0, 30))
         
         # Login button
-        login_btn = ctk.CTkButton(
+        self.login_btn = ctk.CTkButton(
             container,
             text="Login",
             width=300,
@@ -80,7 +85,7 @@ class LoginScreen:
             command=self.handle_login,
             font=ctk.CTkFont(size=14, weight="bold")
         )
-        login_btn.pack(pady=(0, 10))
+        self.login_btn.pack(pady=(0, 10))
         
         # Register button
         register_btn = ctk.CTkButton(
@@ -111,10 +116,31 @@ class LoginScreen:
             messagebox.showerror("Error", "Please enter both username and password")
             return
         
-        if self.db.verify_user(username, password):
+        if self._login_future is not None:
+            return
+        
+        self.login_btn.configure(text="Signing in...", state="disabled")
+        self._login_future = self._executor.submit(self.db.verify_user, username, password)
+        self.window.after(50, self._poll_login, username)
+    
+    def _poll_login(self, username):
+        """Wait for the background credential check without blocking the UI"""
+        if not self._login_future.done():
+            self.window.after(50, self._poll_login, username)
+            return
+        
+        future, self._login_future = self._login_future, None
+        try:
+            verified = future.result()
+        except Exception:
+            verified = False
+        
+        if verified:
+            self._executor.shutdown(wait=False)
             self.window.destroy()
             self.on_login_success(username)
         else:
+            self.login_btn.configure(text="Login", state="normal")
             messagebox.showerror("Error", "Invalid username or password")
             self.password_entry.delete(0, 'end')
     
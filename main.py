@@ -3,11 +3,7 @@ Main Application Entry Point
 Uptime Monitor Desktop Application
 """
 
-import sys
-import os
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import logging
 
 from database import Database
 from monitor_engine import MonitorEngine
@@ -17,6 +13,9 @@ from dashboard import Dashboard
 
 def main():
     """Main application entry point"""
+    # Logging is configured here rather than in the library modules
+    logging.basicConfig(level=logging.INFO)
+    
     # Initialize database
     db = Database()
     
@@ -6,21 +6,50 @@ Handles background monitoring of HTTP, Keyword, and Heartbeat monitors
 import requests
 import threading
 import time
-from datetime import datetime
+import heapq
+import queue
+import itertools
 from typing import Callable, Dict, Optional
 import logging
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Checks are I/O-bound; this many workers serve every monitor
+MAX_CHECK_WORKERS = 32
+
+# Keyword checks stop reading a page after this many bytes
+MAX_KEYWORD_SCAN_BYTES = 1024 * 1024
+
+# Status logs older than this are pruned once a day
+LOG_RETENTION_DAYS = 30
+LOG_PRUNE_INTERVAL = 24 * 60 * 60
+
 class MonitorEngine:
     def __init__(self, database, notification_manager):
         self.db = database
         self.notification_manager = notification_manager
-        self.monitoring_threads = {}
-        self.stop_flags = {}
+        self.active_monitors = {}
+        
+        # Monitor rows by id, so starting monitors skips the SELECT
+        self.monitor_cache = {}
         self.status_callbacks = []
         self.running = False
+        
+        # A single scheduler thread hands due checks to a small worker pool
+        self._schedule = []
+        self._schedule_seq = itertools.count()
+        self._schedule_cond = threading.Condition()
+        self._check_queue = queue.Queue()
+        self._threads_started = False
+        
+        # One pooled session so repeated checks reuse keep-alive and TLS connections
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=64, pool_maxsize=64, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # Status updates are batched by the database; tell the UI once they land
+        self.db.add_write_listener(self.notify_status_change)
     
     def add_status_callback(self, callback: Callable):
         """Add a callback to be notified of status changes"""
@@ -38,104 +67,165 @@ class MonitorEngine:
         """Start monitoring all enabled monitors"""
         self.running = True
         monitors = self.db.get_all_monitors()
+        self.monitor_cache.update((monitor['id'], monitor) for monitor in monitors)
         
         for monitor in monitors:
             if monitor['enabled']:
                 self.start_monitor(monitor['id'])
     
     def stop_all_monitors(self):
-        """Stop all monitoring threads"""
+        """Stop all monitors"""
         self.running = False
         
-        for monitor_id in list(self.stop_flags.keys()):
+        for monitor_id in list(self.active_monitors.keys()):
             self.stop_monitor(monitor_id)
         
-        # Wait for all threads to finish
-        for thread in list(self.monitoring_threads.values()):
-            if thread.is_alive():
-                thread.join(timeout=5)
+        self.notification_manager.flush_now()
+        self.db.flush_writes()
     
     def start_monitor(self, monitor_id: int):
         """Start monitoring a specific monitor"""
-        if monitor_id in self.monitoring_threads:
+        if monitor_id in self.active_monitors:
             logger.warning(f"Monitor {monitor_id} is already running")
             return
         
-        monitor = self.db.get_monitor(monitor_id)
+        monitor = self.get_monitor(monitor_id)
         if not monitor:
             logger.error(f"Monitor {monitor_id} not found")
             return
         
-        self.stop_flags[monitor_id] = threading.Event()
-        
-        thread = threading.Thread(
-            target=self._monitor_loop,
-            args=(monitor,),
-            daemon=True,
-            name=f"Monitor-{monitor_id}"
-        )
+        state = {
+            'monitor': monitor,
+            'previous_status': monitor.get('status', 'UNKNOWN')
+        }
         
-        self.monitoring_threads[monitor_id] = thread
-        thread.start()
+        self._start_threads()
+        with self._schedule_cond:
+            self.active_monitors[monitor_id] = state
+            self._schedule_check(state, time.monotonic())
         logger.info(f"Started monitoring: {monitor['name']} (ID: {monitor_id})")
     
     def stop_monitor(self, monitor_id: int):
         """Stop monitoring a specific monitor"""
-        if monitor_id in self.stop_flags:
-            self.stop_flags[monitor_id].set()
-            
-            # Wait for thread to finish
-            if monitor_id in self.monitoring_threads:
-                thread = self.monitoring_threads[monitor_id]
-                if thread.is_alive():
-                    thread.join(timeout=5)
-                
-                del self.monitoring_threads[monitor_id]
-            
-            del self.stop_flags[monitor_id]
+        with self._schedule_cond:
+            state = self.active_monitors.pop(monitor_id, None)
+        
+        # Stopped monitors are being deleted or edited; reload them next time
+        self.invalidate_monitor(monitor_id)
+        
+        # Pending schedule entries are dropped when they come due
+        if state is not None:
             logger.info(f"Stopped monitoring: {monitor_id}")
     
-    def _monitor_loop(self, monitor: Dict):
-        """Main monitoring loop for a single monitor"""
-        monitor_id = monitor['id']
-        interval = monitor['interval']
-        previous_status = monitor.get('status', 'UNKNOWN')
+    def get_monitor(self, monitor_id: int) -> Optional[Dict]:
+        """Get a monitor row, reading the database only on a cache miss"""
+        monitor = self.monitor_cache.get(monitor_id)
+        if monitor is None:
+            monitor = self.db.get_monitor(monitor_id)
+            if monitor:
+                self.monitor_cache[monitor_id] = monitor
+        return monitor
+    
+    def invalidate_monitor(self, monitor_id: int = None):
+        """Forget a cached monitor row (or all of them)"""
+        if monitor_id is None:
+            self.monitor_cache.clear()
+        else:
+            self.monitor_cache.pop(monitor_id, None)
+    
+    def _start_threads(self):
+        """Start the scheduler and check workers on first use"""
+        with self._schedule_cond:
+            if self._threads_started:
+                return
+            self._threads_started = True
         
-        while not self.stop_flags[monitor_id].is_set() and self.running:
-            try:
-                # Perform the check based on monitor type
-                status, response_time, error_message = self._check_monitor(monitor)
+        threading.Thread(target=self._scheduler_loop, daemon=True, name="Monitor-scheduler").start()
+        threading.Thread(target=self._prune_loop, daemon=True, name="Monitor-log-pruner").start()
+        for i in range(MAX_CHECK_WORKERS):
+            threading.Thread(target=self._worker_loop, daemon=True, name=f"Monitor-worker-{i}").start()
+    
+    def _schedule_check(self, state: Dict, due: float):
+        """Queue the next check for a monitor; caller holds _schedule_cond"""
+        heapq.heappush(self._schedule, (due, next(self._schedule_seq), state))
+        self._schedule_cond.notify()
+    
+    def _scheduler_loop(self):
+        """Dispatch checks to the workers as they come due"""
+        with self._schedule_cond:
+            while True:
+                if not self._schedule:
+                    self._schedule_cond.wait()
+                    continue
                 
-                # Update database
-                self.db.update_monitor_status(
-                    monitor_id, status, response_time, error_message
-                )
+                due, _, state = self._schedule[0]
+                delay = due - time.monotonic()
+                if delay > 0:
+                    self._schedule_cond.wait(timeout=delay)
+                    continue
                 
-                # Notify UI
-                self.notify_status_change(monitor_id, status)
+                heapq.heappop(self._schedule)
+                if self._is_active(state):
+                    self._check_queue.put(state)
+    
+    def _prune_loop(self):
+        """Keep status_logs bounded to the retention window"""
+        while True:
+            try:
+                deleted = self.db.prune_logs(days=LOG_RETENTION_DAYS)
+                if deleted:
+                    logger.info(f"Pruned {deleted} status logs older than {LOG_RETENTION_DAYS} days")
+            except Exception as e:
+                logger.error(f"Error pruning status logs: {e}")
+            time.sleep(LOG_PRUNE_INTERVAL)
+    
+    def _worker_loop(self):
+        """Run queued checks, rescheduling each monitor after its check"""
+        while True:
+            state = self._check_queue.get()
+            self._run_check(state)
+            
+            with self._schedule_cond:
+                if self._is_active(state):
+                    self._schedule_check(state, time.monotonic() + state['monitor']['interval'])
+    
+    def _is_active(self, state: Dict) -> bool:
+        return self.running and self.active_monitors.get(state['monitor']['id']) is state
+    
+    def _run_check(self, state: Dict):
+        """Check a single monitor once and record the result"""
+        monitor = state['monitor']
+        monitor_id = monitor['id']
+        previous_status = state['previous_status']
+        
+        try:
+            # Perform the check based on monitor type
+            status, response_time, error_message = self._check_monitor(monitor)
+            
+            # Queue the database update; the UI is notified once it is written
+            self.db.enqueue_status_update(
+                monitor_id, status, response_time, error_message
+            )
+            
+            # Check if status changed and send notifications
+            if status != previous_status:
+                logger.info(f"Monitor {monitor['name']} status changed: {previous_status} -> {status}")
                 
-                # Check if status changed and send notifications
-                if status != previous_status:
-                    logger.info(f"Monitor {monitor['name']} status changed: {previous_status} -> {status}")
-                    
-                    if status == 'DOWN':
-                        self.notification_manager.send_notifications(
-                            monitor_id,
-                            monitor['name'],
-                            status,
-                            error_message or "Service is down"
-                        )
-                    
-                    previous_status = status
+                if status == 'DOWN':
+                    self.notification_manager.send_notifications(
+                        monitor_id,
+                        monitor['name'],
+                        status,
+                        error_message or "Service is down"
+                    )
                 
-            except Exception as e:
-                logger.error(f"Error monitoring {monitor['name']}: {e}")
-                self.db.update_monitor_status(
-                    monitor_id, 'ERROR', None, str(e)
-                )
+                state['previous_status'] = status
             
-            # Wait for next check interval
-            self.stop_flags[monitor_id].wait(timeout=interval)
+        except Exception as e:
+            logger.error(f"Error monitoring {monitor['name']}: {e}")
+            self.db.enqueue_status_update(
+                monitor_id, 'ERROR', None, str(e)
+            )
     
     def _check_monitor(self, monitor: Dict) -> tuple:
         """
@@ -150,8 +240,13 @@ class MonitorEngine:
                 return self._check_http(url)
             
             elif monitor_type == 'KEYWORD':
-                keyword = monitor.get('keyword', '')
-                return self._check_keyword(url, keyword)
+                keyword = monitor.get('keyword') or ''
+                
+                # Encode the needle once per monitor row rather than on every check
+                needle = monitor.get('keyword_bytes')
+                if needle is None:
+                    needle = monitor['keyword_bytes'] = keyword.encode('utf-8', 'ignore')
+                return self._check_keyword(url, keyword, needle=needle)
             
             elif monitor_type == 'HEARTBEAT':
                 return self._check_heartbeat(monitor)
@@ -166,9 +261,14 @@ class MonitorEngine:
     def _check_http(self, url: str, timeout: int = 10) -> tuple:
         """Check HTTP endpoint for 2xx status code"""
         try:
-            start_time = time.time()
-            response = requests.get(url, timeout=timeout, allow_redirects=True)
-            response_time = (time.time() - start_time) * 1000  # Convert to ms
+            start = time.perf_counter_ns()
+            
+            # Only the status code matters, so skip the body where the server allows it
+            response = self.session.head(url, timeout=timeout, allow_redirects=True)
+            if response.status_code in (405, 501):
+                response = self.session.get(url, timeout=timeout, allow_redirects=True, stream=True)
+                response.close()
+            response_time = (time.perf_counter_ns() - start) / 1e6  # Convert to ms
             
             if 200 <= response.status_code < 300:
                 return 'UP', response_time, None
@@ -184,22 +284,25 @@ class MonitorEngine:
         except Exception as e:
             return 'DOWN', None, f"Error: {str(e)[:100]}"
     
-    def _check_keyword(self, url: str, keyword: str, timeout: int = 10) -> tuple:
+    def _check_keyword(self, url: str, keyword: str, timeout: int = 10,
+                       needle: Optional[bytes] = None) -> tuple:
         """Check if keyword exists in page HTML"""
         try:
-            start_time = time.time()
-            response = requests.get(url, timeout=timeout, allow_redirects=True)
-            response_time = (time.time() - start_time) * 1000
-            
-            if response.status_code >= 400:
-                return 'DOWN', response_time, f"HTTP {response.status_code}"
-            
-            if keyword and keyword in response.text:
-                return 'UP', response_time, None
-            elif keyword:
+            start = time.perf_counter_ns()
+            with self.session.get(url, timeout=timeout, allow_redirects=True, stream=True) as response:
+                response_time = (time.perf_counter_ns() - start) / 1e6
+                
+                if response.status_code >= 400:
+                    return 'DOWN', response_time, f"HTTP {response.status_code}"
+                
+                if not keyword:
+                    return 'DOWN', response_time, "No keyword specified"
+                
+                if needle is None:
+                    needle = keyword.encode('utf-8', 'ignore')
+                if self._stream_contains(response, needle):
+                    return 'UP', response_time, None
                 return 'DOWN', response_time, f"Keyword '{keyword}' not found"
-            else:
-                return 'DOWN', response_time, "No keyword specified"
         
         except requests.exceptions.Timeout:
             return 'DOWN', None, "Connection timeout"
@@ -210,6 +313,22 @@ class MonitorEngine:
         except Exception as e:
             return 'DOWN', None, f"Error: {str(e)[:100]}"
     
+    def _stream_contains(self, response, needle: bytes) -> bool:
+        """Search the raw body for needle, stopping at the first match"""
+        # Carry the end of the previous chunk so matches spanning chunks are found
+        overlap = len(needle) - 1
+        tail = b''
+        scanned = 0
+        for chunk in response.iter_content(chunk_size=16384):
+            window = tail + chunk
+            if needle in window:
+                return True
+            tail = window[-overlap:] if overlap else b''
+            scanned += len(chunk)
+            if scanned >= MAX_KEYWORD_SCAN_BYTES:
+                break
+        return False
+    
     def _check_heartbeat(self, monitor: Dict) -> tuple:
         """
         Check heartbeat monitor
@@ -224,8 +343,8 @@ class MonitorEngine:
             return 'UP', 0, None
         
         try:
-            last_check_time = datetime.fromisoformat(last_check)
-            time_diff = (datetime.now() - last_check_time).total_seconds()
+            # last_check is stored as Unix epoch seconds
+            time_diff = time.time() - last_check
             
             # If no heartbeat received in 2x the interval, consider it DOWN
             if time_diff > (interval * 2):
@@ -238,6 +357,8 @@ class MonitorEngine:
     
     def manual_check(self, monitor_id: int) -> Dict:
         """Manually trigger a check for a monitor"""
+        # Read the row fresh: the cached one keeps the status and last_check
+        # from when it was loaded, which heartbeat checks depend on
         monitor = self.db.get_monitor(monitor_id)
         if not monitor:
             return {'error': 'Monitor not found'}
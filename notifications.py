@@ -3,190 +3,561 @@ Notification Manager
 Handles AWS SNS and Webhook notifications
 """
 
-import boto3
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 from typing import Optional
 import json
+import concurrent.futures
+import time
+import threading
+import uuid
+import queue
+import collections
+from datetime import datetime
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Settings rows read by load_settings
+SETTINGS_KEYS = ('aws_access_key', 'aws_secret_key', 'aws_region', 'sns_topic_arn', 'webhook_url',
+                 'webhook_batch_mode')
+
+# One boto3 session for every SNS client, created on first use so boto3 is
+# only imported when SNS is configured. Sessions are not thread-safe, so
+# clients are created under a lock.
+_SNS_SESSION = None
+_SNS_CONFIG = None
+_SNS_SESSION_LOCK = threading.Lock()
+
+# PublishBatch accepts at most 10 entries per request
+SNS_BATCH_SIZE = 10
+
+def _create_sns_client(**kwargs):
+    """Create an SNS client from the shared session"""
+    global _SNS_SESSION, _SNS_CONFIG
+    with _SNS_SESSION_LOCK:
+        if _SNS_SESSION is None:
+            import boto3
+            from botocore.config import Config
+            
+            _SNS_SESSION = boto3.session.Session()
+            # Pooled keep-alive connections so repeated publishes skip the TLS handshake
+            _SNS_CONFIG = Config(
+                max_pool_connections=50,
+                retries={'mode': 'standard', 'max_attempts': 3},
+                tcp_keepalive=True
+            )
+        return _SNS_SESSION.client('sns', config=_SNS_CONFIG, **kwargs)
+
+def _now_str() -> str:
+    """Get current timestamp as string"""
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
 class NotificationManager:
+    # Alert text, parsed once; only the fields are substituted per alert
+    _SUBJECT_TEMPLATE = "🚨 Alert: {name} is {status}"
+    _BODY_TEMPLATE = (
+        "\n"
+        "Uptime Monitor Alert\n"
+        "====================\n"
+        "\n"
+        "Monitor: {name}\n"
+        "Status: {status}\n"
+        "Message: {msg}\n"
+        "Monitor ID: {mid}\n"
+        "Time: {ts}\n"
+        "\n"
+        "This is an automated alert from your Uptime Monitoring system.\n"
+    )
+    
+    # Fixed test messages; the webhook one only gets a fresh timestamp
+    _TEST_SNS_MESSAGE = {
+        'Subject': "Test Notification from Uptime Monitor",
+        'Message': "This is a test notification. Your SNS integration is working correctly!"
+    }
+    _TEST_WEBHOOK_PAYLOAD = {
+        'test': True,
+        'message': 'This is a test notification from Uptime Monitor'
+    }
+    
     def __init__(self, database):
         self.db = database
         self.sns_client = None
+        self._sns_credentials = None
+        self._sns_publish = None
+        self._sns_publish_batch = None
+        self._topic_kwargs = {}
+        self._channels = ()
+        
+        # SNS alerts are buffered briefly and sent up to 10 per PublishBatch call
+        self._sns_buffer = []
+        self._sns_buffer_lock = threading.Lock()
+        self._sns_flush_deadline = None
+        self._sns_flush_interval = 0.2
+        
+        # Runs SNS batches and connection tests on long-lived threads
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=8, thread_name_prefix="Notification"
+        )
+        
+        # Webhook POSTs run on their own thread, one at a time and in alert
+        # order, so a slow receiver never holds up the dispatcher or SNS
+        self._webhook_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="Notification-webhook"
+        )
+        
+        # Alerts are queued by the monitor workers and sent from this thread,
+        # so a check never waits on SNS or the webhook
+        self._notification_queue = queue.Queue()
+        self._worker = threading.Thread(
+            target=self._notification_loop, daemon=True, name="Notification-dispatcher"
+        )
+        self._worker.start()
+        
+        # (monitor_id, status) -> last send time; repeats inside the window are
+        # dropped so a flapping monitor doesn't fire an alert per flap
+        self._dedupe = collections.OrderedDict()
+        self._dedupe_ttl = 60
+        self._dedupe_max = 1024
+        self._dedupe_lock = threading.Lock()
         self.sns_topic_arn = None
         self.webhook_url = None
+        
+        # Circuit breaker: after _webhook_fail_max consecutive failures the
+        # webhook is skipped for _webhook_reset_timeout seconds
+        self._webhook_failures = 0
+        self._webhook_open_until = 0.0
+        self._webhook_fail_max = 5
+        self._webhook_reset_timeout = 30
+        
+        # In batch mode webhook events are held until the dispatcher queue
+        # drains, then POSTed together as {"events": [...]}
+        self._webhook_batch_mode = False
+        self._webhook_buffer = []
+        self._webhook_buffer_lock = threading.Lock()
+        
+        # Pooled webhook session: keep-alive sockets, JSON header set once, and
+        # short retries on gateway errors only (POST is opted in explicitly).
+        # Connect and read failures are not retried: a slow receiver may have
+        # already accepted the alert, and the timeout bounds must hold.
+        self._http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                connect=0,
+                read=0,
+                other=0,
+                backoff_factor=0.2,
+                status_forcelist=[502, 503, 504],
+                allowed_methods=frozenset({'POST'}),
+                raise_on_status=False
+            )
+        )
+        self._http.mount('https://', adapter)
+        self._http.mount('http://', adapter)
+        self._http.headers.update({'Content-Type': 'application/json'})
+        
+        # Minimum seconds between test sends per channel, so repeated clicks
+        # don't each cost a real API call
+        self._last_test = {}
+        self._test_min_interval = 2
+        
+        # Settings are read in one query and reused until the TTL expires
+        self._settings_cache = {}
+        self._cache_expiry = 0.0
+        self._cache_ttl = 60
         self.load_settings()
     
     def load_settings(self):
-        """Load notification settings from database"""
+        """Load notification settings from database (cached for _cache_ttl seconds)"""
+        if time.monotonic() < self._cache_expiry:
+            return
+        
+        self._settings_cache = self.db.get_settings_bulk(list(SETTINGS_KEYS))
+        self._cache_expiry = time.monotonic() + self._cache_ttl
+        self._apply_settings(self._settings_cache)
+    
+    def _apply_settings(self, settings: dict):
+        """Configure clients and channels from a settings dict"""
         # AWS SNS Settings
-        aws_access_key = self.db.get_setting('aws_access_key')
-        aws_secret_key = self.db.get_setting('aws_secret_key')
-        aws_region = self.db.get_setting('aws_region', 'us-east-1')
-        self.sns_topic_arn = self.db.get_setting('sns_topic_arn')
+        aws_access_key = settings.get('aws_access_key')
+        aws_secret_key = settings.get('aws_secret_key')
+        aws_region = settings.get('aws_region', 'us-east-1')
+        self.sns_topic_arn = settings.get('sns_topic_arn')
+        self._topic_kwargs = {'TopicArn': self.sns_topic_arn}
         
-        if aws_access_key and aws_secret_key:
+        # Only build a new client when the credentials or region changed
+        credentials = (aws_access_key, aws_secret_key, aws_region)
+        if aws_access_key and aws_secret_key and credentials != self._sns_credentials:
             try:
-                self.sns_client = boto3.client(
-                    'sns',
+                self.sns_client = _create_sns_client(
                     aws_access_key_id=aws_access_key,
                     aws_secret_access_key=aws_secret_key,
                     region_name=aws_region
                 )
+                self._sns_credentials = credentials
+                self._sns_publish = self.sns_client.publish
+                self._sns_publish_batch = self.sns_client.publish_batch
                 logger.info("AWS SNS client initialized")
             except Exception as e:
-                logger.error(f"Failed to initialize AWS SNS: {e}")
+                logger.error("Failed to initialize AWS SNS: %s", e)
+        
+        # Webhook Settings; a new URL gets a closed breaker
+        webhook_url = settings.get('webhook_url')
+        if webhook_url != self.webhook_url:
+            self._webhook_failures = 0
+            self._webhook_open_until = 0.0
+        self.webhook_url = webhook_url
+        batch_mode = settings.get('webhook_batch_mode') or ''
+        self._webhook_batch_mode = batch_mode.lower() in ('1', 'true', 'yes', 'on')
         
-        # Webhook Settings
-        self.webhook_url = self.db.get_setting('webhook_url')
+        # Resolve the configured channels once instead of on every alert
+        channels = []
+        if self.sns_client and self.sns_topic_arn:
+            channels.append(self._send_sns)
+        if self.webhook_url:
+            channels.append(self._buffer_webhook if self._webhook_batch_mode else self._queue_webhook)
+        self._channels = tuple(channels)
     
     def update_settings(self, aws_access_key: str = None, aws_secret_key: str = None,
                        aws_region: str = None, sns_topic_arn: str = None,
                        webhook_url: str = None):
         """Update notification settings"""
-        if aws_access_key:
-            self.db.set_setting('aws_access_key', aws_access_key)
-        
-        if aws_secret_key:
-            self.db.set_setting('aws_secret_key', aws_secret_key)
+        settings = {
+            'aws_access_key': aws_access_key,
+            'aws_secret_key': aws_secret_key,
+            'aws_region': aws_region,
+            'sns_topic_arn': sns_topic_arn,
+            'webhook_url': webhook_url
+        }
         
-        if aws_region:
-            self.db.set_setting('aws_region', aws_region)
+        # Save everything that was provided in a single commit
+        updates = {key: value for key, value in settings.items() if value}
+        self.db.set_settings(updates)
         
-        if sns_topic_arn:
-            self.db.set_setting('sns_topic_arn', sns_topic_arn)
-        
-        if webhook_url:
-            self.db.set_setting('webhook_url', webhook_url)
-        
-        # Reload settings
-        self.load_settings()
+        # Merge into the cache rather than re-reading what was just written;
+        # the SNS client is only rebuilt if the credentials changed
+        self._settings_cache.update(updates)
+        self._apply_settings(self._settings_cache)
     
     def send_notifications(self, monitor_id: int, monitor_name: str, 
                           status: str, message: str):
-        """Send all configured notifications"""
-        # Send SNS notification
-        if self.sns_client and self.sns_topic_arn:
-            self._send_sns(monitor_id, monitor_name, status, message)
+        """Queue all configured notifications for the dispatcher thread"""
+        # Refresh first so channels configured elsewhere are picked up once the TTL expires
+        self.load_settings()
+        if not self._channels:
+            return
         
-        # Send Webhook notification
-        if self.webhook_url:
-            self._send_webhook(monitor_id, monitor_name, status, message)
+        if self._is_duplicate(monitor_id, status):
+            logger.info("Suppressed repeat %s alert for %s", status, monitor_name)
+            return
+        
+        # Stamped now so the alert time is when the status changed
+        self._notification_queue.put_nowait(
+            (monitor_id, monitor_name, status, message, _now_str())
+        )
     
-    def _send_sns(self, monitor_id: int, monitor_name: str, 
-                  status: str, message: str) -> bool:
-        """Send AWS SNS notification"""
-        try:
-            subject = f"🚨 Alert: {monitor_name} is {status}"
-            
-            body = f"""
-Uptime Monitor Alert
-====================
-
-Monitor: {monitor_name}
-Status: {status}
-Message: {message}
-Monitor ID: {monitor_id}
-Time: {self._get_timestamp()}
-
-This is an automated alert from your Uptime Monitoring system.
-"""
+    def _is_duplicate(self, monitor_id: int, status: str) -> bool:
+        """Check and record an alert against the cooldown window"""
+        key = (monitor_id, status)
+        now = time.monotonic()
+        with self._dedupe_lock:
+            last_sent = self._dedupe.get(key)
+            if last_sent is not None and now - last_sent < self._dedupe_ttl:
+                return True
             
-            response = self.sns_client.publish(
-                TopicArn=self.sns_topic_arn,
-                Subject=subject,
-                Message=body
-            )
-            
-            logger.info(f"SNS notification sent for {monitor_name}: {response['MessageId']}")
+            self._dedupe[key] = now
+            self._dedupe.move_to_end(key)
+            if len(self._dedupe) > self._dedupe_max:
+                self._dedupe.popitem(last=False)
+        return False
+    
+    def _notification_loop(self):
+        """Send queued alerts one at a time"""
+        while True:
+            # Wake up when a partial SNS batch is due, so no timer thread is needed
+            deadline = self._sns_flush_deadline
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+            try:
+                event = self._notification_queue.get(timeout=timeout)
+            except queue.Empty:
+                self._executor.submit(self._flush_sns_buffer)
+                with self._sns_buffer_lock:
+                    if self._sns_flush_deadline == deadline:
+                        self._sns_flush_deadline = None
+                continue
             
-            self.db.log_notification(
-                monitor_id, 'SNS', status, 
-                f"MessageId: {response['MessageId']}"
+            try:
+                self._dispatch(*event)
+                
+                # Queue drained: send every webhook event held for this tick
+                if self._notification_queue.empty() and self._webhook_buffer:
+                    self._webhook_executor.submit(self._run_webhook_job, self._flush_webhook_buffer)
+            except Exception as e:
+                logger.error("Error dispatching notification: %s", e)
+            finally:
+                self._notification_queue.task_done()
+    
+    def _dispatch(self, monitor_id: int, monitor_name: str,
+                  status: str, message: str, timestamp: str):
+        """Send one alert to every configured channel"""
+        # Pick up settings saved elsewhere once the cache expires
+        self.load_settings()
+        
+        log_rows = []
+        
+        # Neither channel does network I/O here: SNS buffers for the executor
+        # and the webhook is handed to its own thread, so the two overlap
+        for channel in self._channels:
+            channel(monitor_id, monitor_name, status, message, timestamp, log_rows)
+        
+        # One insert for everything this cycle logged
+        if log_rows:
+            self.db.log_notifications_bulk(log_rows)
+    
+    def _send_sns(self, monitor_id: int, monitor_name: str, 
+                  status: str, message: str, timestamp: str, log_rows: list):
+        """Queue an AWS SNS notification for the next batch (logged when the batch is sent)"""
+        subject = self._SUBJECT_TEMPLATE.format(name=monitor_name, status=status)
+        body = self._BODY_TEMPLATE.format(
+            name=monitor_name, status=status, msg=message,
+            mid=monitor_id, ts=timestamp
+        )
+        
+        entry = {
+            'Id': f"{monitor_id}-{uuid.uuid4().hex[:8]}",
+            'Subject': subject,
+            'Message': body
+        }
+        
+        with self._sns_buffer_lock:
+            self._sns_buffer.append((entry, monitor_id, monitor_name, status))
+            if len(self._sns_buffer) >= SNS_BATCH_SIZE:
+                flush_now = True
+            else:
+                flush_now = False
+                if self._sns_flush_deadline is None:
+                    self._sns_flush_deadline = time.monotonic() + self._sns_flush_interval
+        
+        if flush_now:
+            self._executor.submit(self._flush_sns_buffer)
+    
+    def flush_now(self):
+        """Send every queued alert and buffered SNS/webhook notification"""
+        while True:
+            try:
+                event = self._notification_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                self._dispatch(*event)
+            finally:
+                self._notification_queue.task_done()
+        
+        # Let an alert the dispatcher is already sending finish too
+        self._notification_queue.join()
+        self._flush_sns_buffer()
+        
+        # Runs after every webhook already handed to the webhook thread
+        self._webhook_executor.submit(self._run_webhook_job, self._flush_webhook_buffer).result()
+    
+    def _flush_sns_buffer(self):
+        """Publish every buffered SNS notification"""
+        with self._sns_buffer_lock:
+            pending, self._sns_buffer = self._sns_buffer, []
+            self._sns_flush_deadline = None
+        
+        for i in range(0, len(pending), SNS_BATCH_SIZE):
+            try:
+                self._publish_sns_batch(pending[i:i + SNS_BATCH_SIZE])
+            except Exception as e:
+                logger.error("Error flushing SNS notifications: %s", e)
+    
+    def _publish_sns_batch(self, batch: list) -> bool:
+        """Send up to SNS_BATCH_SIZE queued notifications in one request"""
+        try:
+            response = self._sns_publish_batch(
+                **self._topic_kwargs,
+                PublishBatchRequestEntries=[entry for entry, _, _, _ in batch]
             )
-            
-            return True
         
         except Exception as e:
-            logger.error(f"Failed to send SNS notification: {e}")
-            self.db.log_notification(
-                monitor_id, 'SNS', 'FAILED', str(e)
-            )
+            logger.error("Failed to send SNS notification: %s", e)
+            self.db.log_notifications_bulk([
+                (monitor_id, 'SNS', 'FAILED', str(e)) for _, monitor_id, _, _ in batch
+            ])
             return False
+        
+        # Entries succeed or fail individually
+        queued = {entry['Id']: (monitor_id, monitor_name, status)
+                  for entry, monitor_id, monitor_name, status in batch}
+        log_rows = []
+        
+        for result in response.get('Successful', []):
+            monitor_id, monitor_name, status = queued[result['Id']]
+            logger.info("SNS notification sent for %s: %s", monitor_name, result['MessageId'])
+            log_rows.append((monitor_id, 'SNS', status, f"MessageId: {result['MessageId']}"))
+        
+        for result in response.get('Failed', []):
+            monitor_id, monitor_name, _ = queued[result['Id']]
+            error = f"{result.get('Code')}: {result.get('Message', '')}"
+            logger.error("Failed to send SNS notification for %s: %s", monitor_name, error)
+            log_rows.append((monitor_id, 'SNS', 'FAILED', error))
+        
+        self.db.log_notifications_bulk(log_rows)
+        return not response.get('Failed')
     
     def _send_webhook(self, monitor_id: int, monitor_name: str, 
-                     status: str, message: str) -> bool:
-        """Send webhook notification"""
+                     status: str, message: str, timestamp: str, log_rows: list) -> bool:
+        """Send webhook notification, appending its log row to log_rows"""
+        payload = self._webhook_payload(monitor_id, monitor_name, status, message, timestamp)
+        return self._post_webhook(payload, [(monitor_id, monitor_name, status)], log_rows)
+    
+    def _queue_webhook(self, monitor_id: int, monitor_name: str,
+                       status: str, message: str, timestamp: str, log_rows: list):
+        """Hand a webhook notification to the webhook thread (logged when it is sent)"""
+        self._webhook_executor.submit(
+            self._run_webhook_job, self._send_logged_webhook,
+            monitor_id, monitor_name, status, message, timestamp
+        )
+    
+    def _send_logged_webhook(self, monitor_id: int, monitor_name: str,
+                             status: str, message: str, timestamp: str):
+        """Send one webhook notification and log its result"""
+        log_rows = []
+        self._send_webhook(monitor_id, monitor_name, status, message, timestamp, log_rows)
+        self.db.log_notifications_bulk(log_rows)
+    
+    @staticmethod
+    def _run_webhook_job(func, *args):
+        """Run a webhook job, logging errors instead of leaving them on the future"""
         try:
-            payload = {
-                'monitor_id': monitor_id,
-                'monitor_name': monitor_name,
-                'status': status,
-                'message': message,
-                'timestamp': self._get_timestamp()
-            }
-            
-            response = requests.post(
+            func(*args)
+        except Exception as e:
+            logger.error("Error sending webhook notification: %s", e)
+    
+    def _buffer_webhook(self, monitor_id: int, monitor_name: str,
+                        status: str, message: str, timestamp: str, log_rows: list):
+        """Hold a webhook event for the next batch (logged when the batch is sent)"""
+        payload = self._webhook_payload(monitor_id, monitor_name, status, message, timestamp)
+        with self._webhook_buffer_lock:
+            self._webhook_buffer.append((payload, (monitor_id, monitor_name, status)))
+    
+    def _flush_webhook_buffer(self):
+        """POST every buffered webhook event in one request"""
+        with self._webhook_buffer_lock:
+            pending, self._webhook_buffer = self._webhook_buffer, []
+        if not pending:
+            return
+        
+        log_rows = []
+        self._post_webhook(
+            {'events': [payload for payload, _ in pending]},
+            [event for _, event in pending],
+            log_rows
+        )
+        self.db.log_notifications_bulk(log_rows)
+    
+    def _post_webhook(self, payload: dict, events: list, log_rows: list) -> bool:
+        """POST a payload covering events [(monitor_id, monitor_name, status)]"""
+        names = ', '.join(monitor_name for _, monitor_name, _ in events)
+        if time.monotonic() < self._webhook_open_until:
+            logger.warning("Webhook circuit open, skipping notification for %s", names)
+            log_rows.extend((monitor_id, 'WEBHOOK', 'SKIPPED', 'circuit open') for monitor_id, _, _ in events)
+            return False
+        
+        try:
+            response = self._http.post(
                 self.webhook_url,
-                json=payload,
-                headers={'Content-Type': 'application/json'},
+                data=self._encode_payload(payload),
                 timeout=10
             )
             
             response.raise_for_status()
             
-            logger.info(f"Webhook notification sent for {monitor_name}: {response.status_code}")
+            logger.info("Webhook notification sent for %s: %s", names, response.status_code)
             
-            self.db.log_notification(
-                monitor_id, 'WEBHOOK', status,
-                f"Status: {response.status_code}"
+            log_rows.extend(
+                (monitor_id, 'WEBHOOK', status, f"Status: {response.status_code}")
+                for monitor_id, _, status in events
             )
+            self._webhook_failures = 0
             
             return True
         
         except Exception as e:
-            logger.error(f"Failed to send webhook notification: {e}")
-            self.db.log_notification(
-                monitor_id, 'WEBHOOK', 'FAILED', str(e)
-            )
+            logger.error("Failed to send webhook notification: %s", e)
+            log_rows.extend((monitor_id, 'WEBHOOK', 'FAILED', str(e)) for monitor_id, _, _ in events)
+            
+            self._webhook_failures += 1
+            if self._webhook_failures >= self._webhook_fail_max:
+                # Stays at the limit, so one failed trial after the pause reopens it
+                self._webhook_open_until = time.monotonic() + self._webhook_reset_timeout
+                logger.warning("Webhook failed %d times in a row, pausing for %ss",
+                               self._webhook_fail_max, self._webhook_reset_timeout)
             return False
     
-    def test_sns_connection(self) -> tuple:
-        """Test AWS SNS connection"""
+    @staticmethod
+    def _webhook_payload(monitor_id: int, monitor_name: str,
+                         status: str, message: str, timestamp: str) -> dict:
+        """Build the JSON body for one webhook event"""
+        return {
+            'monitor_id': monitor_id,
+            'monitor_name': monitor_name,
+            'status': status,
+            'message': message,
+            'timestamp': timestamp
+        }
+    
+    @staticmethod
+    def _encode_payload(payload: dict) -> bytes:
+        """Serialize a webhook payload once; retries resend the same bytes"""
+        return json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    
+    def test_sns_connection(self, timeout: float = 5) -> tuple:
+        """Test AWS SNS connection, giving up after timeout seconds"""
         if not self.sns_client or not self.sns_topic_arn:
             return False, "SNS not configured"
         
+        if self._test_rate_limited('sns'):
+            return False, "Please wait a moment before testing again"
+        
+        # boto3 timeouts are fixed per client, so bound the wait here instead
+        future = self._executor.submit(
+            self._sns_publish,
+            **self._topic_kwargs,
+            **self._TEST_SNS_MESSAGE
+        )
+        
         try:
-            response = self.sns_client.publish(
-                TopicArn=self.sns_topic_arn,
-                Subject="Test Notification from Uptime Monitor",
-                Message="This is a test notification. Your SNS integration is working correctly!"
-            )
+            response = future.result(timeout=timeout)
             return True, f"Test message sent! MessageId: {response['MessageId']}"
         
+        except concurrent.futures.TimeoutError:
+            return False, f"No response from SNS after {timeout}s"
+        
         except Exception as e:
             return False, str(e)
     
-    def test_webhook_connection(self) -> tuple:
+    def test_webhook_connection(self, connect_timeout: float = 3,
+                                read_timeout: float = 5) -> tuple:
         """Test webhook connection"""
         if not self.webhook_url:
             return False, "Webhook URL not configured"
         
+        if self._test_rate_limited('webhook'):
+            return False, "Please wait a moment before testing again"
+        
         try:
-            payload = {
-                'test': True,
-                'message': 'This is a test notification from Uptime Monitor',
-                'timestamp': self._get_timestamp()
-            }
+            payload = dict(self._TEST_WEBHOOK_PAYLOAD, timestamp=_now_str())
             
-            response = requests.post(
+            response = self._http.post(
                 self.webhook_url,
-                json=payload,
-                headers={'Content-Type': 'application/json'},
-                timeout=10
+                data=self._encode_payload(payload),
+                timeout=(connect_timeout, read_timeout)
             )
             
             response.raise_for_status()
@@ -195,8 +566,11 @@ This is an automated alert from your Uptime Monitoring system.
         except Exception as e:
             return False, str(e)
     
-    @staticmethod
-    def _get_timestamp() -> str:
-        """Get current timestamp as string"""
-        from datetime import datetime
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    def _test_rate_limited(self, channel: str) -> bool:
+        """Check and record a test send against the per-channel interval"""
+        now = time.monotonic()
+        if now - self._last_test.get(channel, float('-inf')) < self._test_min_interval:
+            return True
+        
+        self._last_test[channel] = now
+        return False